@@ -18,6 +18,8 @@ from datetime import datetime, timedelta
 from pathlib import Path
 import uuid
 
+import requests
+
 from .validator import PolicyValidator, ValidationResult, ValidationResponse
 
 
@@ -100,19 +102,34 @@ class ActionExecutor:
     NO LLM - only executes validated actions
     """
 
-    def __init__(self, validator: PolicyValidator, audit_logger):
+    def __init__(self, validator: PolicyValidator, audit_logger, http_session=None):
         """
         Args:
             validator: PolicyValidator instance
             audit_logger: AuditLogger instance (from src/security/audit_log.py)
+            http_session: Optional requests.Session shared by all backend
+                          calls (keep-alive); the executor opens and owns one
+                          if None (released by close())
         """
         self.validator = validator
         self.audit_logger = audit_logger
+        self._owns_session = http_session is None
+        self.http_session = http_session if http_session is not None else requests.Session()
 
         # Get TTL from policy
         ttl = validator.policy.get('confirm_ttl', 300)
         self.confirmation_manager = ConfirmationManager(ttl_seconds=ttl)
 
+    def _backend_client(self):
+        """Backend client for one action, on the shared HTTP session"""
+        from src.api.backend_client import BackendAPIClient
+        return BackendAPIClient(session=self.http_session)
+
+    def close(self):
+        """Close the pooled HTTP connections (only if the session is ours)"""
+        if self._owns_session:
+            self.http_session.close()
+
     def execute(self, action_name: str, args: Dict[str, Any],
                trigger: str = "cli", agent: str = "executor") -> Dict:
         """
@@ -335,7 +352,7 @@ class ActionExecutor:
 
         log_count = 0
         if os.path.exists(logs_path):
-            log_count = len(list(Path(logs_path).glob("*.jsonl")))
+            log_count = len(list(Path(logs_path).glob("*.jsonl*")))
 
         return {
             'success': True,
@@ -349,8 +366,7 @@ class ActionExecutor:
         """List tasks from backend"""
         # Import backend client
         try:
-            from src.api.backend_client import BackendAPIClient
-            client = BackendAPIClient()
+            client = self._backend_client()
 
             status_filter = args.get('status', 'all')
             # list_tasks returns Dict with 'data' key
@@ -369,8 +385,7 @@ class ActionExecutor:
     def _action_get_task_details(self, args: Dict) -> Dict:
         """Get task details"""
         try:
-            from src.api.backend_client import BackendAPIClient
-            client = BackendAPIClient()
+            client = self._backend_client()
 
             task_id = args['task_id']
             # Use get_task() method (exists in backend_client.py)
@@ -389,8 +404,7 @@ class ActionExecutor:
     def _action_check_backend_health(self, args: Dict) -> Dict:
         """Check backend health"""
         try:
-            from src.api.backend_client import BackendAPIClient
-            client = BackendAPIClient()
+            client = self._backend_client()
 
             # Use connect() method which checks /health endpoint
             is_connected = client.connect()
@@ -526,8 +540,7 @@ class ActionExecutor:
     def _action_create_task(self, args: Dict) -> Dict:
         """Create task in backend"""
         try:
-            from src.api.backend_client import BackendAPIClient
-            client = BackendAPIClient()
+            client = self._backend_client()
 
             task = client.create_task(
                 title=args['title'],
@@ -547,8 +560,7 @@ class ActionExecutor:
     def _action_send_chat_message(self, args: Dict) -> Dict:
         """Send message to AI agent"""
         try:
-            from src.api.backend_client import BackendAPIClient
-            client = BackendAPIClient()
+            client = self._backend_client()
 
             response = client.send_chat_message(
                 message=args['message'],
@@ -566,8 +578,7 @@ class ActionExecutor:
     def _action_send_slack_notification(self, args: Dict) -> Dict:
         """Send Slack notification"""
         try:
-            from src.api.backend_client import BackendAPIClient
-            client = BackendAPIClient()
+            client = self._backend_client()
 
             result = client.send_slack_notification(
                 message=args['message']
@@ -584,8 +595,7 @@ class ActionExecutor:
     def _action_create_github_issue(self, args: Dict) -> Dict:
         """Create GitHub issue"""
         try:
-            from src.api.backend_client import BackendAPIClient
-            client = BackendAPIClient()
+            client = self._backend_client()
 
             issue = client.github_create_issue(
                 repo=args['repo'],
@@ -770,4 +780,5 @@ if __name__ == "__main__":
     print(f"   Success: {result.get('success')}")
     print(f"   Error: {result.get('error')}")
 
+    executor.close()
     print("\n" + "=" * 60)
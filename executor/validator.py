@@ -34,6 +34,12 @@ class ValidationResponse:
     violations: Optional[List[str]] = None
 
 
+# Arg values the args-only checks may be cached for. The type is part of the
+# cache key: 10 == 10.0 == True, but only one of them is an 'integer'
+_CACHEABLE_TYPES = (str, int, float, bool, type(None))
+_NOT_CACHED = object()
+
+
 class PolicyValidator:
     """
     Validates all actions against policy.yaml
@@ -45,6 +51,9 @@ class PolicyValidator:
     - Path security
     """
 
+    # Max. cached (action, args) entries of the args-only checks
+    DECISION_CACHE_SIZE = 1024
+
     def __init__(self, policy_path: Optional[str] = None):
         """Load policy.yaml"""
         if policy_path is None:
@@ -53,14 +62,21 @@ class PolicyValidator:
             )
 
         self.policy_path = Path(policy_path)
+        self._policy_mtime_ns = None
         self.policy = self._load_policy()
         self.rate_tracker = {}  # {action_name: [(timestamp, success), ...]}
 
+        # Results of the args-only checks (steps 1-3, no filesystem access):
+        # {(policy_version, action, ((arg, type, value), ...)): denial or None}
+        self._decision_cache = {}
+        self._policy_version = 0
+
     def _load_policy(self) -> Dict:
         """Load and parse policy.yaml"""
         if not self.policy_path.exists():
             raise FileNotFoundError(f"Policy file not found: {self.policy_path}")
 
+        mtime_ns = self.policy_path.stat().st_mtime_ns
         with open(self.policy_path, 'r') as f:
             policy = yaml.safe_load(f)
 
@@ -70,11 +86,31 @@ class PolicyValidator:
             if key not in policy:
                 raise ValueError(f"Policy missing required key: {key}")
 
+        self._policy_mtime_ns = mtime_ns
         return policy
 
     def reload_policy(self):
         """Reload policy from disk (for testing/updates)"""
         self.policy = self._load_policy()
+        self._policy_version += 1
+        self._decision_cache.clear()
+
+    def _check_policy_file(self):
+        """Reload policy.yaml if it changed on disk (one stat per validation)"""
+        try:
+            mtime_ns = self.policy_path.stat().st_mtime_ns
+        except OSError:
+            return  # Keep the loaded policy
+
+        if mtime_ns == self._policy_mtime_ns:
+            return
+
+        try:
+            self.reload_policy()
+        except (OSError, ValueError, TypeError, yaml.YAMLError) as e:
+            # Invalid/half-written file: keep the last valid policy
+            self._policy_mtime_ns = mtime_ns
+            print(f"⚠️  Policy reload failed, keeping previous policy: {e}")
 
     def validate_action(self, action_name: str, args: Dict[str, Any]) -> ValidationResponse:
         """
@@ -83,35 +119,30 @@ class PolicyValidator:
         Returns:
             ValidationResponse with result, reason, and metadata
         """
+        self._check_policy_file()
         violations = []
 
-        # 1. Check if action exists
-        if action_name not in self.policy['actions']:
+        # 1.-3. Action, risk and args schema (cached)
+        denial = self._static_denial(action_name, args)
+        if denial is not None:
+            reason, risk_level, denial_violations = denial
             return ValidationResponse(
                 result=ValidationResult.DENIED,
-                reason=f"Action '{action_name}' not defined in policy",
-                violations=["action_not_found"]
+                reason=reason,
+                risk_level=risk_level,
+                violations=list(denial_violations)
             )
 
         action_def = self.policy['actions'][action_name]
         risk_level = action_def.get('risk', 3)
 
-        # 2. Check if action is CRITICAL (always denied)
-        if risk_level == 3:
+        # 3b. Path containment of schema args (resolves symlinks: never cached)
+        containment = self._check_must_be_under(args, action_def)
+        if containment:
+            violations.extend(containment)
             return ValidationResponse(
                 result=ValidationResult.DENIED,
-                reason=action_def.get('deny_reason', 'Action is permanently blocked'),
-                risk_level=3,
-                violations=["critical_risk"]
-            )
-
-        # 3. Validate arguments schema
-        schema_validation = self._validate_args_schema(action_name, args, action_def)
-        if not schema_validation[0]:
-            violations.extend(schema_validation[1])
-            return ValidationResponse(
-                result=ValidationResult.DENIED,
-                reason=f"Schema validation failed: {', '.join(schema_validation[1])}",
+                reason=f"Schema validation failed: {', '.join(containment)}",
                 risk_level=risk_level,
                 violations=violations
             )
@@ -178,6 +209,81 @@ class PolicyValidator:
             }
         )
 
+    def _static_denial(self, action_name: str,
+                       args: Dict[str, Any]) -> Optional[Tuple[str, Optional[int], Tuple[str, ...]]]:
+        """
+        Steps 1-3 - depend only on policy + args, so the result is cached
+        Returns: None if passed, else (reason, risk_level, violations)
+        """
+        if not all(type(v) in _CACHEABLE_TYPES for v in args.values()):
+            # Lists etc.: no cache key
+            return self._check_static(action_name, args)
+
+        key = (
+            self._policy_version,
+            action_name,
+            tuple(sorted((name, type(value), value) for name, value in args.items()))
+        )
+        denial = self._decision_cache.get(key, _NOT_CACHED)
+        if denial is _NOT_CACHED:
+            denial = self._check_static(action_name, args)
+            if len(self._decision_cache) >= self.DECISION_CACHE_SIZE:
+                self._decision_cache.clear()
+            self._decision_cache[key] = denial
+
+        return denial
+
+    def _check_static(self, action_name: str,
+                      args: Dict[str, Any]) -> Optional[Tuple[str, Optional[int], Tuple[str, ...]]]:
+        """
+        Action exists, not CRITICAL, args match the schema
+        Returns: None if passed, else (reason, risk_level, violations)
+        """
+        # 1. Check if action exists
+        if action_name not in self.policy['actions']:
+            return (f"Action '{action_name}' not defined in policy", None, ("action_not_found",))
+
+        action_def = self.policy['actions'][action_name]
+        risk_level = action_def.get('risk', 3)
+
+        # 2. Check if action is CRITICAL (always denied)
+        if risk_level == 3:
+            return (
+                action_def.get('deny_reason', 'Action is permanently blocked'),
+                3,
+                ("critical_risk",)
+            )
+
+        # 3. Validate arguments schema
+        schema_validation = self._validate_args_schema(action_name, args, action_def)
+        if not schema_validation[0]:
+            return (
+                f"Schema validation failed: {', '.join(schema_validation[1])}",
+                risk_level,
+                tuple(schema_validation[1])
+            )
+
+        return None
+
+    def _check_must_be_under(self, args: Dict, action_def: Dict) -> List[str]:
+        """
+        Check must_be_under (path containment) of string args
+        Returns: [violations]
+        """
+        violations = []
+
+        for arg_name, arg_spec in action_def.get('args_schema', {}).items():
+            root_key = arg_spec.get('must_be_under')
+            arg_value = args.get(arg_name)
+            if root_key is None or arg_spec.get('type') != 'string' or not isinstance(arg_value, str):
+                continue
+
+            root_path = self.policy.get('root_paths', {}).get(root_key)
+            if root_path and not self._is_path_under_root(arg_value, root_path):
+                violations.append(f"{arg_name} must be under {root_path}")
+
+        return violations
+
     def _validate_args_schema(self, action_name: str, args: Dict,
                             action_def: Dict) -> Tuple[bool, List[str]]:
         """
@@ -222,13 +328,8 @@ class PolicyValidator:
                     if not re.match(arg_spec['pattern'], arg_value):
                         violations.append(f"{arg_name} doesn't match pattern {arg_spec['pattern']}")
 
-                # Check must_be_under (path containment)
-                if 'must_be_under' in arg_spec:
-                    root_key = arg_spec['must_be_under']
-                    root_path = self.policy.get('root_paths', {}).get(root_key)
-                    if root_path:
-                        if not self._is_path_under_root(arg_value, root_path):
-                            violations.append(f"{arg_name} must be under {root_path}")
+                # must_be_under (path containment) is checked per call in
+                # _check_must_be_under: it resolves symlinks
 
             # Type: integer
             elif arg_type == 'integer':
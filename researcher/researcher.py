@@ -397,4 +397,5 @@ if __name__ == "__main__":
     if result.get('needs_confirmation'):
         print(f"\nActions needing confirmation: {len(result['needs_confirmation'])}")
 
+    executor.close()
     print("\n" + "=" * 60)
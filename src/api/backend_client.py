@@ -15,7 +15,8 @@ import time
 class BackendAPIClient:
     """Client for Code Cloud Agents Backend API"""
 
-    def __init__(self, base_url: str = "http://localhost:3000", ws_url: str = "ws://localhost:3000/ws"):
+    def __init__(self, base_url: str = "http://localhost:3000", ws_url: str = "ws://localhost:3000/ws",
+                 session: Optional[requests.Session] = None):
         self.base_url = base_url
         self.ws_url = ws_url
         self.ws: Optional[WebSocket] = None
@@ -24,10 +25,15 @@ class BackendAPIClient:
         self.token: Optional[str] = None
         self.message_handlers = []
 
+        # Keep-alive: all REST calls reuse pooled connections (optionally a
+        # session shared with other clients - that one is not closed here)
+        self._owns_session = session is None
+        self.session = session if session is not None else requests.Session()
+
     def connect(self) -> bool:
         """Check if backend is reachable"""
         try:
-            response = requests.get(f"{self.base_url}/health", timeout=5)
+            response = self.session.get(f"{self.base_url}/health", timeout=5)
             self.connected = response.status_code == 200
             print(f"✅ Backend connected: {self.base_url}")
             return self.connected
@@ -39,7 +45,7 @@ class BackendAPIClient:
     def login(self, email: str, password: str) -> bool:
         """Login to backend and get token"""
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/auth/login",
                 json={"email": email, "password": password},
                 timeout=10
@@ -70,7 +76,7 @@ class BackendAPIClient:
     def create_task(self, title: str, description: str = "", priority: str = "medium", assignee: str = "cloud_assistant") -> Dict:
         """Create a new task"""
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/tasks",
                 json={
                     "title": title,
@@ -94,7 +100,7 @@ class BackendAPIClient:
             params = {}
             if status:
                 params["status"] = status
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/api/tasks",
                 params=params,
                 headers=self.get_headers(),
@@ -110,7 +116,7 @@ class BackendAPIClient:
     def get_task(self, task_id: str) -> Dict:
         """Get task details"""
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/api/tasks/{task_id}",
                 headers=self.get_headers(),
                 timeout=10
@@ -129,7 +135,7 @@ class BackendAPIClient:
     def send_chat_message(self, message: str, agent_name: str = "emir", user_id: str = "local_user") -> Dict:
         """Send a chat message to an agent"""
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/chat/send",
                 json={
                     "message": message,
@@ -151,7 +157,7 @@ class BackendAPIClient:
     def get_chat_history(self, user_id: str = "local_user") -> Dict:
         """Get chat history"""
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/api/memory/chats/{user_id}",
                 headers=self.get_headers(),
                 timeout=10
@@ -175,7 +181,7 @@ class BackendAPIClient:
         try:
             # This will be handled by the backend's Slack integration
             # We'll create a custom endpoint for agent-specific messages
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/agents/slack/send",
                 json={
                     "agentType": agent_type,
@@ -199,7 +205,7 @@ class BackendAPIClient:
     def github_create_issue(self, repo: str, title: str, body: str = "", labels: List[str] = None) -> Dict:
         """Create GitHub issue"""
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/github/issues",
                 json={
                     "repo": repo,
@@ -231,7 +237,7 @@ class BackendAPIClient:
             if team_id:
                 payload["teamId"] = team_id
 
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/linear/issues",
                 json=payload,
                 headers=self.get_headers(),
@@ -297,6 +303,12 @@ class BackendAPIClient:
             self.ws = None
             print("WebSocket disconnected")
 
+    def close(self):
+        """Close the WebSocket and the pooled HTTP connections"""
+        self.disconnect_websocket()
+        if self._owns_session:
+            self.session.close()
+
 
 # Example usage
 if __name__ == "__main__":
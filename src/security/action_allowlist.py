@@ -4,8 +4,10 @@ Security layer to prevent dangerous operations
 """
 
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Dict, FrozenSet, List, Optional, Tuple
 from dataclasses import dataclass
+from collections import defaultdict, deque
+from time import monotonic
 import re
 
 
@@ -23,11 +25,15 @@ class AllowedAction:
     name: str
     risk_level: RiskLevel
     description: str
-    requires_params: List[str]
+    requires_params: FrozenSet[str]
     max_frequency: Optional[int] = None  # Max executions per hour
     requires_unlock: bool = False
     dry_run_available: bool = True
 
+    def __post_init__(self):
+        # Frozen for O(1) missing-param checks (accepts any iterable)
+        self.requires_params = frozenset(self.requires_params)
+
 
 class ActionAllowlist:
     """
@@ -37,7 +43,9 @@ class ActionAllowlist:
 
     def __init__(self):
         self.allowed_actions = self._build_allowlist()
-        self.execution_log = []  # Track frequency
+        self._index_allowlist()
+        # Track frequency: monotonic execution times per action (last 1000 each)
+        self._by_action: Dict[str, deque] = defaultdict(lambda: deque(maxlen=1000))
 
     def _build_allowlist(self) -> Dict[str, AllowedAction]:
         """Build the allowlist of safe actions"""
@@ -216,49 +224,73 @@ class ActionAllowlist:
             ),
         }
 
+    def _index_allowlist(self):
+        """
+        Build flat per-field lookup tables from the allowlist
+        (AllowedAction stays the external API, validation reads these)
+        """
+        actions = self.allowed_actions.values()
+
+        self._risk = {a.name: a.risk_level for a in actions}
+        self._params = {a.name: a.requires_params for a in actions}
+        self._maxfreq = {a.name: a.max_frequency for a in actions}
+
+        self._blocked = {a.name for a in actions if a.risk_level == RiskLevel.CRITICAL}
+        self._confirm_set = {
+            a.name for a in actions
+            if a.risk_level in (RiskLevel.MEDIUM, RiskLevel.HIGH)
+        }
+
     def is_allowed(self, action_name: str) -> bool:
         """Check if action is in allowlist"""
-        return action_name in self.allowed_actions
+        return action_name in self._risk
 
     def get_risk_level(self, action_name: str) -> RiskLevel:
         """Get risk level for action"""
-        if not self.is_allowed(action_name):
-            return RiskLevel.CRITICAL
-
-        return self.allowed_actions[action_name].risk_level
+        return self._risk.get(action_name, RiskLevel.CRITICAL)
 
     def requires_confirmation(self, action_name: str) -> bool:
         """Check if action requires user confirmation"""
-        if not self.is_allowed(action_name):
-            return True
-
-        risk = self.get_risk_level(action_name)
-        return risk in [RiskLevel.MEDIUM, RiskLevel.HIGH]
+        return action_name in self._confirm_set or action_name not in self._risk
 
     def is_blocked(self, action_name: str) -> bool:
         """Check if action is permanently blocked"""
-        if not self.is_allowed(action_name):
-            return True
-
-        return self.get_risk_level(action_name) == RiskLevel.CRITICAL
+        return action_name in self._blocked or action_name not in self._risk
 
     def validate_action(self, action_name: str, params: Dict) -> Dict:
         """
         Validate action before execution
         Returns: {"allowed": bool, "reason": str, "requires_confirmation": bool}
         """
+        return self._validate(action_name, params, monotonic())
+
+    def validate_many(self, candidates: List[Tuple[str, Dict]]) -> List[Dict]:
+        """
+        Validate several candidate actions in one pass
+        (e.g. when an ambiguous command maps to multiple actions)
+
+        Args:
+            candidates: List of (action_name, params) pairs
+
+        Returns: One validate_action-style result per candidate, in order
+        """
+        now = monotonic()
+        validate = self._validate
+        return [validate(name, params, now) for name, params in candidates]
+
+    def _validate(self, action_name: str, params: Dict, now: float) -> Dict:
+        """Validate a single action against the allowlist at time `now`"""
         # Check if action exists in allowlist
-        if not self.is_allowed(action_name):
+        risk_level = self._risk.get(action_name)
+        if risk_level is None:
             return {
                 "allowed": False,
                 "reason": f"Action '{action_name}' not in allowlist",
                 "requires_confirmation": False
             }
 
-        action = self.allowed_actions[action_name]
-
         # Check if blocked
-        if action.risk_level == RiskLevel.CRITICAL:
+        if action_name in self._blocked:
             return {
                 "allowed": False,
                 "reason": f"Action '{action_name}' is permanently blocked for security",
@@ -266,21 +298,22 @@ class ActionAllowlist:
             }
 
         # Check required parameters
-        missing_params = [p for p in action.requires_params if p not in params]
+        missing_params = self._params[action_name].difference(params)
         if missing_params:
             return {
                 "allowed": False,
-                "reason": f"Missing required parameters: {missing_params}",
+                "reason": f"Missing required parameters: {sorted(missing_params)}",
                 "requires_confirmation": False
             }
 
         # Check frequency limit
-        if action.max_frequency:
-            recent_count = self._count_recent_executions(action_name)
-            if recent_count >= action.max_frequency:
+        max_frequency = self._maxfreq[action_name]
+        if max_frequency:
+            recent_count = self._count_recent_executions(action_name, now)
+            if recent_count >= max_frequency:
                 return {
                     "allowed": False,
-                    "reason": f"Frequency limit exceeded: {recent_count}/{action.max_frequency} per hour",
+                    "reason": f"Frequency limit exceeded: {recent_count}/{max_frequency} per hour",
                     "requires_confirmation": False
                 }
 
@@ -288,32 +321,28 @@ class ActionAllowlist:
         return {
             "allowed": True,
             "reason": "OK",
-            "requires_confirmation": self.requires_confirmation(action_name),
-            "risk_level": action.risk_level.value,
-            "description": action.description
+            "requires_confirmation": action_name in self._confirm_set,
+            "risk_level": risk_level.value,
+            "description": self.allowed_actions[action_name].description
         }
 
-    def _count_recent_executions(self, action_name: str) -> int:
+    def _count_recent_executions(self, action_name: str,
+                                 now: Optional[float] = None) -> int:
         """Count executions in last hour"""
-        from datetime import datetime, timedelta
+        timestamps = self._by_action.get(action_name)
+        if not timestamps:
+            return 0
+
+        # Entries are time-ordered, so expired ones sit at the left end
+        one_hour_ago = (monotonic() if now is None else now) - 3600.0
+        while timestamps and timestamps[0] <= one_hour_ago:
+            timestamps.popleft()
 
-        one_hour_ago = datetime.now() - timedelta(hours=1)
-        return sum(1 for log in self.execution_log
-                   if log["action"] == action_name and log["timestamp"] > one_hour_ago)
+        return len(timestamps)
 
     def log_execution(self, action_name: str, success: bool):
         """Log action execution"""
-        from datetime import datetime
-
-        self.execution_log.append({
-            "action": action_name,
-            "timestamp": datetime.now(),
-            "success": success
-        })
-
-        # Keep only last 1000 entries
-        if len(self.execution_log) > 1000:
-            self.execution_log = self.execution_log[-1000:]
+        self._by_action[action_name].append(monotonic())
 
 
 class InputSanitizer:
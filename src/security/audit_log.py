@@ -3,12 +3,104 @@ Audit Log System
 Logs all actions for security review
 """
 
+import atexit
+import gzip
 import json
+import mmap
 import os
-from datetime import datetime
-from typing import Dict, List, Optional
+import queue
+import shutil
+import tempfile
+import threading
+from collections import Counter, deque
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional
 from pathlib import Path
 
+try:
+    import ahocorasick  # Optional: pyahocorasick for multi-term search
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson  # Optional: much faster JSON (de)serialization
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack  # Optional: compact binary sidecar log (binary_log=True)
+except ImportError:
+    msgpack = None
+
+# Leading timestamp field of every entry (orjson writes no space after the colon)
+TIMESTAMP_MARKER = b'"timestamp":'
+
+
+@dataclass
+class AuditRecord:
+    """
+    One log_action entry with the result fields flattened
+
+    Written as-is (no nested result dict per call); readers fold the
+    result_* fields back into the documented "result" sub-dict.
+    """
+    __slots__ = ("timestamp", "action", "agent", "trigger", "params",
+                 "result_success", "result_message", "result_error",
+                 "risk_level", "user_confirmed", "session_id")
+
+    timestamp: datetime
+    action: str
+    agent: str
+    trigger: str
+    params: Dict
+    result_success: bool
+    result_message: str
+    result_error: Any
+    risk_level: str
+    user_confirmed: bool
+    session_id: int
+
+
+def _json_default(obj):
+    """json.dumps / msgpack fallback for datetime and AuditRecord values"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, AuditRecord):
+        return {name: getattr(obj, name) for name in AuditRecord.__slots__}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+if orjson is not None:
+    def _dumps(entry) -> bytes:
+        """Serialize one log entry (datetime values become ISO strings)"""
+        # orjson serializes (slots) dataclasses natively
+        return orjson.dumps(entry, option=orjson.OPT_NON_STR_KEYS)
+
+    _loads = orjson.loads
+else:
+    def _dumps(entry) -> bytes:
+        """Serialize one log entry (datetime values become ISO strings)"""
+        return json.dumps(entry, default=_json_default).encode()
+
+    _loads = json.loads
+
+
+def _nest_result(entry: Dict) -> Dict:
+    """Fold the flat result_* fields of an AuditRecord back into entry["result"]"""
+    if "result_success" in entry:
+        entry["result"] = {
+            "success": entry.pop("result_success"),
+            "message": entry.pop("result_message", ""),
+            "error": entry.pop("result_error", None)
+        }
+    return entry
+
+
+def _decode(line: bytes) -> Dict:
+    """Parse one JSONL line into the documented entry layout"""
+    return _nest_result(_loads(line))
+
 
 class AuditLogger:
     """
@@ -16,14 +108,196 @@ class AuditLogger:
     Records ALL actions for later review
     """
 
-    def __init__(self, log_dir: Optional[str] = None):
+    # Max entries written per batch by the background flusher
+    FLUSH_BATCH_SIZE = 256
+
+    # Hours of per-hour statistics kept in memory for get_stats()
+    STATS_WINDOW_HOURS = 48
+
+    def __init__(self, log_dir: Optional[str] = None, binary_log: bool = False):
+        """
+        Args:
+            log_dir: Directory for the daily audit_YYYYMMDD.jsonl files
+            binary_log: Also write a msgpack sidecar (audit_YYYYMMDD.mpk) and
+                        serve the machine-read queries from it; JSONL stays
+                        the human-readable log
+        """
+        if binary_log and msgpack is None:
+            raise ImportError("binary_log requires msgpack (pip install msgpack)")
+
         if log_dir is None:
             log_dir = os.path.expanduser("~/activi-dev-repos/super-mac-assistant/logs/audit")
 
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(parents=True, exist_ok=True)
 
-        self.current_log_file = self.log_dir / f"audit_{datetime.now().strftime('%Y%m%d')}.jsonl"
+        # Process ID as session identifier (constant for the process lifetime)
+        self._pid = os.getpid()
+
+        # Keep one append handle open instead of re-opening per entry
+        self.binary_log = binary_log
+        self._lock = threading.Lock()
+        self._fh = None
+        self._bin_fh = None
+        self._rotate(datetime.now().toordinal())
+
+        # Callers only enqueue serialized lines; a daemon thread batches the writes.
+        # After close() there is no flusher: entries are written synchronously
+        self._q = queue.Queue()
+        self._closed = False
+        self._enqueue_lock = threading.Lock()
+        self._flusher = threading.Thread(target=self._flush_loop, daemon=True)
+        self._flusher.start()
+        atexit.register(self.close)
+
+        # Rolling per-hour counters, fed from the log files. Only bytes appended
+        # since the last read are parsed, whichever process wrote them
+        self._stats_lock = threading.Lock()
+        self._stats_read_lock = threading.Lock()
+        self._hourly = deque(maxlen=self.STATS_WINDOW_HOURS)
+        self._stats_offsets = {}  # {jsonl path: bytes counted, None = fully read .gz}
+        self._read_new_stats()
+
+    def _flush_loop(self):
+        """Drain the queue and write entries in batches (None = shutdown)"""
+        q = self._q
+        while True:
+            buf = [q.get()]
+            while len(buf) < self.FLUSH_BATCH_SIZE:
+                try:
+                    buf.append(q.get_nowait())
+                except queue.Empty:
+                    break
+
+            records = [record for record in buf if record is not None]
+            try:
+                if records:
+                    self._write_records(records)
+            except Exception as e:
+                print(f"⚠️  Audit log write failed: {e}")
+            finally:
+                for _ in buf:
+                    q.task_done()
+
+            if len(records) < len(buf):
+                return
+
+    def _log_file_for(self, day: date, suffix: str = ".jsonl") -> Path:
+        """Path of the log file for a given day"""
+        return self.log_dir / f"audit_{day.strftime('%Y%m%d')}{suffix}"
+
+    def _rotate(self, today: int):
+        """Switch the append handle to the file of day `today` (date ordinal)"""
+        previous_file = None
+        if self._fh is not None:
+            self._fh.close()
+            if self._log_day < today:
+                previous_file = self.current_log_file
+        if self._bin_fh is not None:
+            self._bin_fh.close()
+
+        self._log_day = today
+        day = date.fromordinal(today)
+        self.current_log_file = self._log_file_for(day)
+        self._fh = open(self.current_log_file, "ab")
+
+        if self.binary_log:
+            self._bin_fh = open(self._log_file_for(day, ".mpk"), "ab")
+
+        # Finished day: compress in the background (readers fall back to .jsonl.gz)
+        if previous_file is not None:
+            threading.Thread(
+                target=self._compress_log_file, args=(previous_file,), daemon=True
+            ).start()
+
+    @staticmethod
+    def _compress_log_file(path: Path):
+        """Replace a finished day's JSONL file with a gzip-compressed copy"""
+        gz_path = path.with_name(path.name + ".gz")
+        tmp_path = None
+
+        try:
+            if not path.exists() or gz_path.exists():
+                return  # Nothing to do / already compressed by another process
+
+            # Unique temp file: other loggers may compress the same day concurrently
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".gz.tmp")
+            tmp_path = Path(tmp_name)
+            with open(path, "rb") as src, open(fd, "wb") as raw, gzip.open(raw, "wb") as dst:
+                shutil.copyfileobj(src, dst)
+
+            # Publish with a hard link: fails if the .gz exists (exclusive create),
+            # so a complete .gz is never overwritten - the winner removes the source
+            try:
+                os.link(tmp_path, gz_path)
+            except FileExistsError:
+                return
+            path.unlink()
+        except OSError as e:
+            print(f"⚠️  Audit log compression failed for {path}: {e}")
+        finally:
+            if tmp_path is not None:
+                try:
+                    tmp_path.unlink()
+                except OSError:
+                    pass
+
+    def _enqueue(self, log_entry):
+        """Serialize an entry and hand it to the background flusher"""
+        packed = msgpack.packb(log_entry, default=_json_default) if self.binary_log else None
+        record = (_dumps(log_entry) + b"\n", packed)
+
+        with self._enqueue_lock:
+            if not self._closed:
+                self._q.put(record)
+                return
+
+        # Logged after close() (e.g. from a later atexit handler): nobody drains
+        # the queue anymore, so write directly and close the file again
+        self._write_records([record])
+        with self._lock:
+            self._close_files()
+
+    def _write_records(self, records: List[tuple]):
+        """Append serialized (jsonl_line, msgpack_frame) records, switching files at the date boundary"""
+        with self._lock:
+            # Plain int compare per batch; the file name is only built on rotation
+            today = datetime.now().toordinal()
+            if today != self._log_day or self._fh.closed:
+                self._rotate(today)
+
+            self._fh.writelines(line for line, _ in records)
+            self._fh.flush()
+
+            if self._bin_fh is not None:
+                self._bin_fh.writelines(packed for _, packed in records)
+                self._bin_fh.flush()
+
+    def flush(self):
+        """Block until every queued entry has been written"""
+        # A stopped flusher never drains the queue (entries logged after
+        # close() are written synchronously)
+        if self._flusher.is_alive():
+            self._q.join()
+
+    def close(self):
+        """Drain pending entries, stop the flusher and close the log file"""
+        with self._enqueue_lock:
+            if not self._closed:
+                self._closed = True
+                self._q.put(None)  # Queued after every entry: all get written
+
+        self._flusher.join()
+
+        with self._lock:
+            self._close_files()
+
+    def _close_files(self):
+        """Close the log file handles (caller holds self._lock)"""
+        if not self._fh.closed:
+            self._fh.close()
+        if self._bin_fh is not None and not self._bin_fh.closed:
+            self._bin_fh.close()
 
     def log_action(self,
                    action: str,
@@ -46,25 +320,14 @@ class AuditLogger:
             user_confirmed: Was user confirmation required/given
         """
 
-        log_entry = {
-            "timestamp": datetime.now().isoformat(),
-            "action": action,
-            "agent": agent,
-            "trigger": trigger,
-            "params": params,
-            "result": {
-                "success": result.get("success", False),
-                "message": result.get("message", ""),
-                "error": result.get("error")
-            },
-            "risk_level": risk_level,
-            "user_confirmed": user_confirmed,
-            "session_id": os.getpid()  # Process ID as session identifier
-        }
+        record = AuditRecord(
+            datetime.now(), action, agent, trigger, params,
+            result.get("success", False), result.get("message", ""), result.get("error"),
+            risk_level, user_confirmed, self._pid
+        )
 
-        # Write to JSON Lines file
-        with open(self.current_log_file, "a") as f:
-            f.write(json.dumps(log_entry) + "\n")
+        # Queue for the JSON Lines file
+        self._enqueue(record)
 
     def log_security_event(self,
                            event_type: str,
@@ -82,112 +345,360 @@ class AuditLogger:
         """
 
         log_entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": datetime.now(),
             "type": "security_event",
             "event_type": event_type,
             "description": description,
             "severity": severity,
             "details": details or {},
-            "session_id": os.getpid()
+            "session_id": self._pid
         }
 
-        with open(self.current_log_file, "a") as f:
-            f.write(json.dumps(log_entry) + "\n")
+        self._enqueue(log_entry)
+
+    @staticmethod
+    def _hour_key(when: datetime) -> int:
+        """Monotonic index of the (local) hour a timestamp falls into"""
+        return when.toordinal() * 24 + when.hour
+
+    def _read_new_stats(self):
+        """Count the entries appended to yesterday's and today's log since the last call"""
+        self.flush()  # Own queued entries are counted from the file as well
+
+        with self._stats_read_lock:
+            now = datetime.now()
+            paths = [self._log_file_for(now - timedelta(days=1)), self._log_file_for(now)]
+            offsets = {path: self._stats_offsets.get(path, 0) for path in paths}
+
+            for path in paths:
+                offset = offsets[path]
+                if offset is None:
+                    continue  # Compressed file, already counted
+
+                try:
+                    with open(path, "rb") as f:
+                        f.seek(offset)
+                        data = f.read()
+                except FileNotFoundError:
+                    # Compressed at rotation: same bytes, read the rest once
+                    gz_path = path.with_name(path.name + ".gz")
+                    if not gz_path.exists():
+                        continue
+                    with gzip.open(gz_path, "rb") as f:
+                        f.seek(offset)
+                        data = f.read()
+                    offsets[path] = None
+                else:
+                    # A partly written last line is counted on the next call
+                    data = data[:data.rfind(b"\n") + 1]
+                    offsets[path] = offset + len(data)
+
+                for line in data.splitlines():
+                    if not line.strip():
+                        continue
+                    try:
+                        entry = _decode(line)
+                        self._count_entry(entry, datetime.fromisoformat(entry["timestamp"]))
+                    except (ValueError, KeyError, TypeError):
+                        continue
+
+            self._stats_offsets = offsets
+
+    def _count_entry(self, log_entry: Dict, when: datetime):
+        """Add one parsed entry to the in-memory per-hour statistics"""
+        self._count(
+            when,
+            log_entry.get("risk_level", "unknown"),
+            log_entry.get("agent", "unknown"),
+            log_entry.get("trigger", "unknown"),
+            bool(log_entry.get("result", {}).get("success")),
+            security_event=log_entry.get("type") == "security_event"
+        )
+
+    def _count(self, when: datetime, risk_level: str, agent: str, trigger: str,
+               successful: bool, security_event: bool = False):
+        """Add one entry to the in-memory per-hour statistics"""
+        hour = self._hour_key(when)
+
+        with self._stats_lock:
+            bucket = None
+            for candidate in reversed(self._hourly):
+                if candidate["hour"] <= hour:
+                    if candidate["hour"] == hour:
+                        bucket = candidate
+                    break
+
+            if bucket is None:
+                if self._hourly and self._hourly[-1]["hour"] > hour:
+                    return  # Older than the tracked window / out of order
+
+                bucket = {
+                    "hour": hour,
+                    "total_actions": 0,
+                    "by_risk_level": Counter(),
+                    "by_agent": Counter(),
+                    "by_trigger": Counter(),
+                    "successful": 0,
+                    "security_events": 0
+                }
+                self._hourly.append(bucket)
+
+            bucket["total_actions"] += 1
+            bucket["by_risk_level"][risk_level] += 1
+            bucket["by_agent"][agent] += 1
+            bucket["by_trigger"][trigger] += 1
+
+            if successful:
+                bucket["successful"] += 1
+
+            if security_event:
+                bucket["security_events"] += 1
 
     def get_recent_logs(self, hours: int = 24) -> List[Dict]:
         """Get logs from last N hours"""
-        from datetime import timedelta
+        return sorted(self._iter_recent(hours), key=lambda x: x["timestamp"], reverse=True)
+
+    def _iter_recent(self, hours: int = 24):
+        """Yield parsed log entries from the last N hours, newest first"""
+        if self.binary_log:
+            yield from self._iter_recent_binary(hours)
+            return
+
+        for line in self._iter_recent_lines(hours):
+            try:
+                yield _decode(line)
+            except ValueError:
+                continue
+
+    def _iter_recent_binary(self, hours: int = 24):
+        """Yield log entries from the last N hours out of the msgpack sidecar, newest first"""
+        self.flush()  # Include entries still queued for writing
+
+        now = datetime.now()
+        cutoff_time = now - timedelta(hours=hours)
+        log_files = [self._log_file_for(now, ".mpk")]
+
+        # Check yesterday's log file if needed
+        if hours > 12:
+            log_files.append(self._log_file_for(now - timedelta(days=1), ".mpk"))
 
-        cutoff_time = datetime.now() - timedelta(hours=hours)
-        logs = []
+        for log_file in log_files:
+            if not log_file.exists():
+                continue
 
-        # Check today's log file
-        if self.current_log_file.exists():
-            with open(self.current_log_file, "r") as f:
-                for line in f:
+            logs = []
+            with open(log_file, "rb") as f:
+                for log in msgpack.Unpacker(f, raw=False, strict_map_key=False):
                     try:
-                        log = json.loads(line)
-                        log_time = datetime.fromisoformat(log["timestamp"])
-                        if log_time >= cutoff_time:
-                            logs.append(log)
-                    except:
+                        if datetime.fromisoformat(log["timestamp"]) >= cutoff_time:
+                            logs.append(_nest_result(log))
+                    except (ValueError, KeyError, TypeError):
                         continue
 
+            yield from reversed(logs)
+
+    def _iter_recent_lines(self, hours: int = 24):
+        """Yield raw (bytes) log lines from the last N hours, newest first"""
+        self.flush()  # Include entries still queued for writing
+
+        now = datetime.now()
+        cutoff_time = now - timedelta(hours=hours)
+        log_files = [self._log_file_for(now)]
+
         # Check yesterday's log file if needed
         if hours > 12:
-            yesterday_file = self.log_dir / f"audit_{(datetime.now() - timedelta(days=1)).strftime('%Y%m%d')}.jsonl"
-            if yesterday_file.exists():
-                with open(yesterday_file, "r") as f:
-                    for line in f:
-                        try:
-                            log = json.loads(line)
-                            log_time = datetime.fromisoformat(log["timestamp"])
-                            if log_time >= cutoff_time:
-                                logs.append(log)
-                        except:
-                            continue
-
-        return sorted(logs, key=lambda x: x["timestamp"], reverse=True)
+            log_files.append(self._log_file_for(now - timedelta(days=1)))
+
+        for log_file in log_files:
+            if log_file.exists():
+                lines = self._iter_lines_reversed(log_file)
+            else:
+                # Past days may have been compressed at rotation
+                gz_file = log_file.with_name(log_file.name + ".gz")
+                if not gz_file.exists():
+                    continue
+                # gzip only streams forward: decompress once, then walk backwards
+                with gzip.open(gz_file, "rb") as f:
+                    lines = [line.rstrip(b"\n") for line in f if line.strip()]
+                lines.reverse()
+
+            # Entries are appended in time order: scan from the end and stop
+            # at the first entry older than the cutoff
+            for line in lines:
+                try:
+                    if self._line_timestamp(line) < cutoff_time:
+                        break
+                except (ValueError, KeyError):
+                    continue
+                yield line
+
+    @staticmethod
+    def _iter_lines_reversed(path: Path):
+        """Yield the non-empty lines of a file (as bytes) from last to first"""
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return  # mmap cannot map an empty file
+
+            # Map the file and slice out one line at a time: lines before the
+            # cutoff are never copied, decoded or parsed
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                end = len(mm)
+                while end > 0:
+                    start = mm.rfind(b"\n", 0, end) + 1
+                    if start < end:
+                        yield mm[start:end]
+                    end = start - 1
+
+    @staticmethod
+    def _line_timestamp(line: bytes) -> datetime:
+        """Parse only the timestamp of a serialized entry (no full JSON decode)"""
+        start = line.find(TIMESTAMP_MARKER)
+        if start == -1:
+            return datetime.fromisoformat(_loads(line)["timestamp"])
+
+        start = line.index(b'"', start + len(TIMESTAMP_MARKER)) + 1
+        end = line.index(b'"', start)
+        return datetime.fromisoformat(line[start:end].decode())
 
     def get_stats(self, hours: int = 24) -> Dict:
-        """Get statistics about recent activity"""
-        logs = self.get_recent_logs(hours)
+        """
+        Get statistics about recent activity
+
+        Served from the in-memory per-hour counters (hour granularity, at
+        most STATS_WINDOW_HOURS). Each call first counts what was appended
+        to the log files since the last one - by any process.
+        """
+        self._read_new_stats()
 
         stats = {
-            "total_actions": len(logs),
-            "by_risk_level": {},
-            "by_agent": {},
-            "by_trigger": {},
+            "total_actions": 0,
+            "by_risk_level": Counter(),
+            "by_agent": Counter(),
+            "by_trigger": Counter(),
             "success_rate": 0,
             "security_events": 0
         }
 
         successful = 0
+        oldest_hour = self._hour_key(datetime.now()) - hours
 
-        for log in logs:
-            # Count by risk level
-            risk = log.get("risk_level", "unknown")
-            stats["by_risk_level"][risk] = stats["by_risk_level"].get(risk, 0) + 1
-
-            # Count by agent
-            agent = log.get("agent", "unknown")
-            stats["by_agent"][agent] = stats["by_agent"].get(agent, 0) + 1
+        with self._stats_lock:
+            for bucket in self._hourly:
+                if bucket["hour"] <= oldest_hour:
+                    continue
 
-            # Count by trigger
-            trigger = log.get("trigger", "unknown")
-            stats["by_trigger"][trigger] = stats["by_trigger"].get(trigger, 0) + 1
+                stats["total_actions"] += bucket["total_actions"]
+                stats["security_events"] += bucket["security_events"]
+                successful += bucket["successful"]
 
-            # Count success
-            if log.get("result", {}).get("success"):
-                successful += 1
+                # Counter.update adds the per-hour counts in C
+                stats["by_risk_level"].update(bucket["by_risk_level"])
+                stats["by_agent"].update(bucket["by_agent"])
+                stats["by_trigger"].update(bucket["by_trigger"])
 
-            # Count security events
-            if log.get("type") == "security_event":
-                stats["security_events"] += 1
+        for key in ("by_risk_level", "by_agent", "by_trigger"):
+            stats[key] = dict(stats[key])
 
-        if len(logs) > 0:
-            stats["success_rate"] = round((successful / len(logs)) * 100, 2)
+        if stats["total_actions"] > 0:
+            stats["success_rate"] = round((successful / stats["total_actions"]) * 100, 2)
 
         return stats
 
     def search_logs(self, query: str, hours: int = 24) -> List[Dict]:
         """Search logs by text query"""
-        logs = self.get_recent_logs(hours)
+        query_bytes = query.lower().encode()
         results = []
 
-        query_lower = query.lower()
+        # Match on the raw line; only hits are decoded
+        for line in self._iter_recent_lines(hours):
+            if query_bytes in line.lower():
+                try:
+                    results.append(_decode(line))
+                except ValueError:
+                    continue
+
+        return results
+
+    def search_logs_multi(self, queries: List[str], hours: int = 24) -> Dict[str, List[Dict]]:
+        """
+        Search logs for several text queries in a single pass
+
+        Uses an Aho-Corasick automaton when pyahocorasick is installed,
+        otherwise one substring test per query.
 
-        for log in logs:
-            log_str = json.dumps(log).lower()
-            if query_lower in log_str:
-                results.append(log)
+        Returns:
+            {query: [matching logs]}
+        """
+        results = {query: [] for query in queries}
+        if not queries:
+            return results
+
+        # Queries differing only in case share one search term
+        by_term: Dict[str, List[str]] = {}
+        for query in results:
+            by_term.setdefault(query.lower(), []).append(query)
+        # An empty query matches every entry, as in search_logs("")
+        match_all = by_term.pop("", [])
+
+        automaton = None
+        if ahocorasick is not None and by_term:
+            automaton = ahocorasick.Automaton()
+            for term in by_term:
+                automaton.add_word(term, term)
+            automaton.make_automaton()
+
+        for line in self._iter_recent_lines(hours):
+            text = line.decode(errors="replace").lower()
+
+            if automaton is not None:
+                terms = {term for _, term in automaton.iter(text)}
+            else:
+                terms = {term for term in by_term if term in text}
+
+            if terms or match_all:
+                try:
+                    log = _decode(line)
+                except ValueError:
+                    continue
+                for term in terms:
+                    for query in by_term[term]:
+                        results[query].append(log)
+                for query in match_all:
+                    results[query].append(log)
 
         return results
 
     def export_report(self, hours: int = 24) -> str:
         """Export a human-readable report"""
-        logs = self.get_recent_logs(hours)
-        stats = self.get_stats(hours)
+        stats = {
+            "total_actions": 0,
+            "by_risk_level": Counter(),
+            "by_agent": Counter(),
+            "by_trigger": Counter(),
+            "success_rate": 0,
+            "security_events": 0
+        }
+        successful = 0
+        logs = []  # Newest 20 entries
+
+        # Single pass: statistics and recent entries from the same scan
+        for log in self._iter_recent(hours):
+            stats["total_actions"] += 1
+            stats["by_risk_level"][log.get("risk_level", "unknown")] += 1
+            stats["by_agent"][log.get("agent", "unknown")] += 1
+            stats["by_trigger"][log.get("trigger", "unknown")] += 1
+
+            if log.get("result", {}).get("success"):
+                successful += 1
+
+            if log.get("type") == "security_event":
+                stats["security_events"] += 1
+
+            if len(logs) < 20:
+                logs.append(log)
+
+        if stats["total_actions"] > 0:
+            stats["success_rate"] = round((successful / stats["total_actions"]) * 100, 2)
 
         report = []
         report.append("=" * 60)
@@ -222,7 +733,7 @@ class AuditLogger:
         report.append("RECENT ACTIONS")
         report.append("-" * 60)
 
-        for log in logs[:20]:  # Show last 20
+        for log in logs:  # Show last 20
             timestamp = log.get("timestamp", "unknown")
             action = log.get("action", "unknown")
             agent = log.get("agent", "unknown")
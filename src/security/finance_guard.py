@@ -19,11 +19,78 @@ Layer 3: Runtime Detection
 """
 
 import os
+import re
 import subprocess
+import time
+from collections import Counter, deque
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
+try:
+    import psutil  # Optional: mount table without spawning `mount`
+except ImportError:
+    psutil = None
+
+try:
+    import ahocorasick  # Optional: pyahocorasick for single-pass multi-pattern matching
+except ImportError:
+    ahocorasick = None
+
+
+def _path_parts(path: str) -> List[str]:
+    """
+    Split a path into the components of its canonical absolute form
+
+    realpath makes relative paths absolute, resolves ".." and symlinks and
+    collapses a leading "//" (which normpath keeps); empty parts are dropped
+    so "//Volumes/Finance" and "/Volumes/Finance" walk the same trie nodes.
+    """
+    return [part for part in os.path.realpath(os.path.expanduser(path)).split(os.sep) if part]
+
+
+def _build_matcher(patterns: List[Tuple[str, str]]):
+    """
+    Build a single-pass matcher over (lowercase, original) patterns
+
+    An Aho-Corasick automaton when pyahocorasick is installed, otherwise one
+    compiled regex alternation used as a "contains any?" pre-check. Returns
+    None (callers fall back to the linear scan) when there are no patterns or
+    one is empty - an empty entry matches anything, with either backend.
+    """
+    if not patterns or not all(pattern for pattern, _ in patterns):
+        return None
+
+    if ahocorasick is None:
+        return re.compile("|".join(re.escape(pattern) for pattern, _ in patterns))
+
+    automaton = ahocorasick.Automaton()
+    for priority, (pattern, original) in enumerate(patterns):
+        if not automaton.exists(pattern):
+            automaton.add_word(pattern, (priority, original))
+    automaton.make_automaton()
+    return automaton
+
+
+def _find_denied(text_lower: str, patterns: List[Tuple[str, str]], matcher) -> Optional[str]:
+    """
+    Return the first deny-list entry (in list order) contained in text_lower
+    """
+    if isinstance(matcher, re.Pattern):
+        # Regex finds *a* match, not the first in list order: only use it to
+        # skip the scan for clean input (the common case)
+        if matcher.search(text_lower) is None:
+            return None
+    elif matcher is not None:
+        matches = [value for _, value in matcher.iter(text_lower)]
+        return min(matches)[1] if matches else None
+
+    for pattern, original in patterns:
+        if pattern in text_lower:
+            return original
+
+    return None
+
 
 class FinanceVolumeGuard:
     """
@@ -31,6 +98,13 @@ class FinanceVolumeGuard:
     Ensures Finance volume remains unmounted
     """
 
+    # Seconds the mount info of get_mount_status() is reused (rapid security polling).
+    # The mounted flag itself is always checked fresh.
+    STATUS_TTL = 2.0
+
+    # Seconds an is_mounted() result is reused within one logical operation
+    MOUNT_CHECK_TTL = 0.5
+
     def __init__(self, volume_name: str = "Finance"):
         """
         Args:
@@ -39,13 +113,43 @@ class FinanceVolumeGuard:
         self.volume_name = volume_name
         self.mount_point = f"/Volumes/{volume_name}"
 
-    def is_mounted(self) -> bool:
-        """Check if Finance volume is mounted"""
-        return os.path.exists(self.mount_point) and os.path.ismount(self.mount_point)
+        self._cached_status: Optional[Dict] = None
+        self._cached_at = 0.0
+
+        self._last_result = False
+        self._last_check: Optional[float] = None
+
+    def _invalidate_cache(self):
+        """Forget cached mount state (after mounting/unmounting)"""
+        self._cached_status = None
+        self._last_check = None
+
+    def is_mounted(self, fresh: bool = False) -> bool:
+        """
+        Check if Finance volume is mounted
+
+        Args:
+            fresh: Skip the memoized result (security checks, lockdown)
+        """
+        now = time.monotonic()
+        if (not fresh and self._last_check is not None
+                and now - self._last_check < self.MOUNT_CHECK_TTL):
+            return self._last_result
+
+        self._last_result = os.path.exists(self.mount_point) and os.path.ismount(self.mount_point)
+        self._last_check = now
+        return self._last_result
 
     def get_mount_status(self) -> Dict:
         """Get detailed mount status"""
-        mounted = self.is_mounted()
+        # Never answer from cache whether the volume is mounted: a mount
+        # within the TTL must show up in the next security check
+        mounted = self.is_mounted(fresh=True)
+
+        now = time.monotonic()
+        if (self._cached_status is not None and now - self._cached_at < self.STATUS_TTL
+                and self._cached_status['mounted'] == mounted):
+            return dict(self._cached_status)
 
         status = {
             'mounted': mounted,
@@ -57,22 +161,38 @@ class FinanceVolumeGuard:
         if mounted:
             # Get mount info
             try:
-                result = subprocess.run(
-                    ['mount'],
-                    capture_output=True,
-                    text=True
-                )
-
-                # Find Finance volume in mount output
-                for line in result.stdout.split('\n'):
-                    if self.mount_point in line:
-                        status['mount_info'] = line.strip()
-                        break
+                mount_info = self._get_mount_info()
+                if mount_info:
+                    status['mount_info'] = mount_info
 
             except Exception as e:
                 status['error'] = str(e)
 
-        return status
+        self._cached_status = status
+        self._cached_at = now
+        return dict(status)
+
+    def _get_mount_info(self) -> Optional[str]:
+        """Find the Finance volume in the mount table"""
+        if psutil is not None:
+            for partition in psutil.disk_partitions(all=True):
+                if partition.mountpoint == self.mount_point:
+                    return (f"{partition.device} on {partition.mountpoint} "
+                            f"({partition.fstype}, {partition.opts})")
+            return None
+
+        # Fallback: parse `mount` output
+        result = subprocess.run(
+            ['mount'],
+            capture_output=True,
+            text=True
+        )
+
+        for line in result.stdout.split('\n'):
+            if self.mount_point in line:
+                return line.strip()
+
+        return None
 
     def force_unmount(self) -> Tuple[bool, str]:
         """
@@ -82,7 +202,7 @@ class FinanceVolumeGuard:
         Returns:
             (success, message)
         """
-        if not self.is_mounted():
+        if not self.is_mounted(fresh=True):
             return (True, "Volume not mounted")
 
         try:
@@ -95,6 +215,7 @@ class FinanceVolumeGuard:
             )
 
             if result.returncode == 0:
+                self._invalidate_cache()
                 return (True, "Volume unmounted successfully")
 
             # If graceful failed, try force
@@ -106,6 +227,7 @@ class FinanceVolumeGuard:
             )
 
             if result.returncode == 0:
+                self._invalidate_cache()
                 return (True, "Volume force unmounted")
             else:
                 return (False, f"Unmount failed: {result.stderr}")
@@ -181,7 +303,27 @@ class FinanceAccessDetector:
         self.deny_apps = policy_guard_config.get('deny_apps', [])
         self.deny_domains = policy_guard_config.get('deny_domains', [])
 
-        self.access_attempts = []  # Log of attempts
+        # Pre-processed once: (normalized, original) pairs for the check methods
+        self._deny_keywords_lc = [(k.lower(), k) for k in self.deny_keywords]
+        self._deny_apps_lc = [(a.lower(), a) for a in self.deny_apps]
+        self._deny_domains_lc = [(d.lower(), d) for d in self.deny_domains]
+
+        # One matcher per list: each input is scanned once, whatever the list size
+        self._keyword_matcher = _build_matcher(self._deny_keywords_lc)
+        self._app_matcher = _build_matcher(self._deny_apps_lc)
+        self._domain_matcher = _build_matcher(self._deny_domains_lc)
+
+        # Deny paths as a trie of path components; the None key marks the end
+        # of a deny path and holds its original (unexpanded) form
+        self._deny_path_trie: Dict = {}
+        for deny_path in self.deny_paths:
+            node = self._deny_path_trie
+            for part in _path_parts(deny_path):
+                node = node.setdefault(part, {})
+            node.setdefault(None, deny_path)
+
+        self.access_attempts = deque(maxlen=1000)  # Log of attempts (last 1000)
+        self._type_counts = Counter()  # Attempts per type, kept in sync with the deque
 
     def check_path_access(self, path: str) -> Tuple[bool, Optional[str]]:
         """
@@ -190,17 +332,16 @@ class FinanceAccessDetector:
         Returns:
             (is_finance_access, matched_deny_path)
         """
-        expanded_path = os.path.expanduser(path)
-
-        for deny_path in self.deny_paths:
-            deny_expanded = os.path.expanduser(deny_path)
-
-            # Check if paths overlap
-            if expanded_path.startswith(deny_expanded):
-                self._log_attempt('path', path, deny_path)
-                return (True, deny_path)
-
-            if deny_expanded in expanded_path:
+        # Walk the trie component by component: matches whole components only,
+        # so /Volumes/FinanceBackup does not match /Volumes/Finance
+        node = self._deny_path_trie
+        for part in _path_parts(path):
+            node = node.get(part)
+            if node is None:
+                break
+
+            deny_path = node.get(None)
+            if deny_path is not None:
                 self._log_attempt('path', path, deny_path)
                 return (True, deny_path)
 
@@ -213,12 +354,11 @@ class FinanceAccessDetector:
         Returns:
             (contains_finance_keyword, matched_keyword)
         """
-        text_lower = text.lower()
+        keyword = _find_denied(text.lower(), self._deny_keywords_lc, self._keyword_matcher)
 
-        for keyword in self.deny_keywords:
-            if keyword.lower() in text_lower:
-                self._log_attempt('keyword', text, keyword)
-                return (True, keyword)
+        if keyword is not None:
+            self._log_attempt('keyword', text, keyword)
+            return (True, keyword)
 
         return (False, None)
 
@@ -229,12 +369,11 @@ class FinanceAccessDetector:
         Returns:
             (is_finance_app, matched_deny_app)
         """
-        app_lower = app_name.lower()
+        deny_app = _find_denied(app_name.lower(), self._deny_apps_lc, self._app_matcher)
 
-        for deny_app in self.deny_apps:
-            if deny_app.lower() in app_lower:
-                self._log_attempt('app', app_name, deny_app)
-                return (True, deny_app)
+        if deny_app is not None:
+            self._log_attempt('app', app_name, deny_app)
+            return (True, deny_app)
 
         return (False, None)
 
@@ -245,45 +384,41 @@ class FinanceAccessDetector:
         Returns:
             (is_finance_domain, matched_deny_domain)
         """
-        url_lower = url.lower()
+        deny_domain = _find_denied(url.lower(), self._deny_domains_lc, self._domain_matcher)
 
-        for deny_domain in self.deny_domains:
-            if deny_domain.lower() in url_lower:
-                self._log_attempt('domain', url, deny_domain)
-                return (True, deny_domain)
+        if deny_domain is not None:
+            self._log_attempt('domain', url, deny_domain)
+            return (True, deny_domain)
 
         return (False, None)
 
     def _log_attempt(self, attempt_type: str, value: str, matched: str):
         """Log finance access attempt"""
+        # The full deque drops its oldest entry on append - un-count it first
+        if len(self.access_attempts) == self.access_attempts.maxlen:
+            self._type_counts[self.access_attempts[0]['type']] -= 1
+
+        self._type_counts[attempt_type] += 1
         self.access_attempts.append({
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': datetime.now().isoformat(),  # For display
+            'ts': time.time(),  # For cheap time-window filtering
             'type': attempt_type,
             'value': value,
             'matched': matched
         })
 
-        # Keep only last 1000
-        if len(self.access_attempts) > 1000:
-            self.access_attempts = self.access_attempts[-1000:]
-
     def get_recent_attempts(self, minutes: int = 60) -> List[Dict]:
         """Get recent access attempts"""
-        from datetime import timedelta
-
-        cutoff = datetime.now() - timedelta(minutes=minutes)
+        cutoff = time.time() - minutes * 60
 
         return [
             attempt for attempt in self.access_attempts
-            if datetime.fromisoformat(attempt['timestamp']) >= cutoff
+            if attempt['ts'] >= cutoff
         ]
 
     def get_stats(self) -> Dict:
         """Get access attempt statistics"""
-        by_type = {}
-        for attempt in self.access_attempts:
-            attempt_type = attempt['type']
-            by_type[attempt_type] = by_type.get(attempt_type, 0) + 1
+        by_type = {t: count for t, count in self._type_counts.items() if count > 0}
 
         return {
             'total_attempts': len(self.access_attempts),
@@ -357,8 +492,9 @@ class FinanceGuard:
         """
         results = []
 
-        # 1. Unmount Finance volume
-        if self.volume_guard.is_mounted():
+        # 1. Unmount Finance volume (never trust a cached "not mounted" here)
+        self.volume_guard._invalidate_cache()
+        if self.volume_guard.is_mounted(fresh=True):
             success, message = self.volume_guard.force_unmount()
             results.append({
                 'action': 'unmount_finance_volume',
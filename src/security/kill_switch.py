@@ -3,12 +3,21 @@ Kill Switch / Panic Button
 Emergency stop for all operations
 """
 
+import fcntl
 import os
+import re
 import signal
+import tempfile
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Optional
 
+# State file location (resolved once per process)
+_STATE_PATH = Path(os.path.expanduser("~/activi-dev-repos/super-mac-assistant/.killswitch"))
+
+# The first byte of the state file identifies the state
+_STATE_CODES = {"a": "active", "p": "paused", "k": "killed"}
+
 
 class KillSwitch:
     """
@@ -17,46 +26,126 @@ class KillSwitch:
     """
 
     def __init__(self):
-        self.state_file = Path(os.path.expanduser("~/activi-dev-repos/super-mac-assistant/.killswitch"))
-        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        self.state_file = _STATE_PATH
+
+        # Parsed state, re-read only when the file changes (mtime/inode/size)
+        self._cache = None
+        self._cache_key = None
+        self._state = None
+        self._state_key = None
 
         # Initialize as active if file doesn't exist
         if not self.state_file.exists():
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
             self._write_state("active")
 
     def _write_state(self, state: str):
-        """Write state to file"""
-        with open(self.state_file, "w") as f:
-            f.write(f"{state}\n{datetime.now().isoformat()}")
+        """Write state to file (atomically: temp file + rename)"""
+        # Readers must never see a truncated file - that would read as "active".
+        # Unique temp file per write: CLI and menu bar may write at the same time
+        fd, tmp_name = tempfile.mkstemp(
+            dir=self.state_file.parent, prefix=self.state_file.name + ".", suffix=".tmp"
+        )
+        try:
+            with open(fd, "w") as f:
+                self._set_nocache(f.fileno())
+                f.write(f"{state}\n{datetime.now().isoformat()}")
+                f.flush()
+                os.fsync(f.fileno())
+                self._drop_from_page_cache(f.fileno())
+            os.replace(tmp_name, self.state_file)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+
+    @staticmethod
+    def _set_nocache(fd: int):
+        """macOS: bypass the page cache for this file (best effort)"""
+        nocache = getattr(fcntl, "F_NOCACHE", None)
+        if nocache is not None:
+            try:
+                fcntl.fcntl(fd, nocache, 1)
+            except OSError:
+                pass
+
+    @staticmethod
+    def _drop_from_page_cache(fd: int):
+        """Linux: release the (already synced) pages of this file (best effort)"""
+        if hasattr(os, "posix_fadvise"):
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+            except OSError:
+                pass
 
     def _read_state(self) -> dict:
-        """Read current state"""
-        if not self.state_file.exists():
+        """Read current state (cached until the state file changes)"""
+        try:
+            st = os.stat(self.state_file)
+        except OSError:
             return {"state": "active", "timestamp": datetime.now()}
 
+        # One stat instead of open+read+parse while nobody wrote the file;
+        # the inode changes with every atomic replace. (No long-lived mmap:
+        # it would keep mapping the replaced inode and miss a CLI "kill".)
+        key = (st.st_mtime_ns, st.st_ino, st.st_size)
+        if key == self._cache_key:
+            return self._cache
+
         try:
             with open(self.state_file, "r") as f:
                 lines = f.read().strip().split("\n")
                 state = lines[0]
                 timestamp = datetime.fromisoformat(lines[1]) if len(lines) > 1 else datetime.now()
-                return {"state": state, "timestamp": timestamp}
-        except:
+        except (OSError, ValueError):
             return {"state": "active", "timestamp": datetime.now()}
 
+        self._cache = {"state": state, "timestamp": timestamp}
+        self._cache_key = key
+        return self._cache
+
+    def _current_state(self) -> str:
+        """
+        Current state name (active/paused/killed)
+
+        Guard-path variant of _read_state: reads only the first byte of the
+        file and never parses the timestamp.
+        """
+        try:
+            st = os.stat(self.state_file)
+        except OSError:
+            return "active"
+
+        key = (st.st_mtime_ns, st.st_ino, st.st_size)
+        if key == self._state_key:
+            return self._state
+
+        try:
+            with open(self.state_file, "r") as f:
+                state = _STATE_CODES.get(f.read(1))
+        except OSError:
+            return "active"
+
+        if state is None:
+            state = self._read_state()["state"]  # Unexpected content: full parse
+
+        self._state = state
+        self._state_key = key
+        return state
+
     def is_active(self) -> bool:
         """Check if system is active (not paused/killed)"""
-        state = self._read_state()
-        return state["state"] == "active"
+        return self._current_state() == "active"
 
     def is_paused(self) -> bool:
         """Check if system is paused"""
-        state = self._read_state()
-        return state["state"] == "paused"
+        return self._current_state() == "paused"
 
     def is_killed(self) -> bool:
         """Check if system is killed"""
-        state = self._read_state()
-        return state["state"] == "killed"
+        return self._current_state() == "killed"
 
     def pause(self):
         """Pause all operations"""
@@ -91,12 +180,13 @@ class KillSwitch:
     def get_status(self) -> dict:
         """Get current status"""
         state_data = self._read_state()
+        state = state_data["state"]
 
         return {
-            "active": self.is_active(),
-            "paused": self.is_paused(),
-            "killed": self.is_killed(),
-            "state": state_data["state"],
+            "active": state == "active",
+            "paused": state == "paused",
+            "killed": state == "killed",
+            "state": state,
             "since": state_data["timestamp"].isoformat()
         }
 
@@ -105,10 +195,12 @@ class KillSwitch:
         Check kill switch and block if not active
         Raise exception if paused/killed
         """
-        if self.is_killed():
+        state = self._current_state()
+
+        if state == "killed":
             raise SystemExit("🛑 System is KILLED. Restart required.")
 
-        if self.is_paused():
+        if state == "paused":
             raise RuntimeError("⏸️  System is PAUSED. Operations blocked.")
 
         # Active - continue
@@ -120,7 +212,7 @@ class PanicPhrase:
     Detect panic phrases in voice commands
     """
 
-    PANIC_PHRASES = [
+    PANIC_PHRASES = (
         "stop everything",
         "emergency stop",
         "kill switch",
@@ -131,18 +223,16 @@ class PanicPhrase:
         "stopp alles",  # German
         "notfall stop",
         "abbrechen",
-    ]
+    )
+
+    # All (casefolded) phrases as one alternation: a single pass over the input
+    _PATTERN = re.compile("|".join(re.escape(p.casefold()) for p in PANIC_PHRASES))
 
     @classmethod
     def detect(cls, text: str) -> bool:
         """Check if text contains panic phrase"""
-        text_lower = text.lower()
-
-        for phrase in cls.PANIC_PHRASES:
-            if phrase in text_lower:
-                return True
-
-        return False
+        # casefold (not IGNORECASE) so German input folds fully, e.g. "ẞ" -> "ss"
+        return cls._PATTERN.search(text.casefold()) is not None
 
     @classmethod
     def handle_panic(cls, text: str, kill_switch: KillSwitch):
@@ -168,7 +258,8 @@ class ConfirmationDialog:
     """
 
     @staticmethod
-    def confirm_action(action_name: str, description: str, risk_level: str) -> bool:
+    def confirm_action(action_name: str, description: str, risk_level: str,
+                       kill_switch: Optional[KillSwitch] = None) -> bool:
         """
         Ask user to confirm action
 
@@ -176,6 +267,7 @@ class ConfirmationDialog:
             action_name: Name of the action
             description: What the action does
             risk_level: low/medium/high/critical
+            kill_switch: KillSwitch to pause on 'pause' (created on demand if None)
 
         Returns:
             bool: True if confirmed, False otherwise
@@ -205,8 +297,7 @@ class ConfirmationDialog:
                 return False
 
             elif response == "pause":
-                kill_switch = KillSwitch()
-                kill_switch.pause()
+                (kill_switch or KillSwitch()).pause()
                 return False
 
             else:
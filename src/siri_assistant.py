@@ -15,6 +15,7 @@ Autor: Super Mac Assistant Team
 
 import sys
 import os
+import atexit
 import subprocess
 import threading
 import time
@@ -22,7 +23,9 @@ import signal
 
 # Projektverzeichnis
 PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, PROJECT_DIR)
+# Nur als Skript nötig - beim Import über das `src`-Paket ist es schon auffindbar
+if "src" not in sys.modules:
+    sys.path.insert(0, PROJECT_DIR)
 
 try:
     import speech_recognition as sr
@@ -33,6 +36,55 @@ except ImportError:
 
 from src.api.backend_client import BackendAPIClient
 
+# Optional: lokale Spracherkennung mit Whisper (int8-quantisiert via CTranslate2)
+# Aktivieren mit z.B. SIRI_WHISPER_MODEL=large-v3 und: pip install faster-whisper
+WHISPER_MODEL = os.environ.get("SIRI_WHISPER_MODEL")
+WHISPER_COMPUTE_TYPE = os.environ.get("SIRI_WHISPER_COMPUTE_TYPE", "int8")
+WHISPER_THREADS = None
+
+
+def _whisper_threads() -> int:
+    """
+    Threads für Whisper: OMP_NUM_THREADS (z.B. "4" oder "4,2"),
+    sonst die physischen Kerne (keine Überbelegung durch Hyperthreads)
+    """
+    try:
+        threads = int(os.environ.get("OMP_NUM_THREADS", "").split(",")[0])
+        if threads > 0:
+            return threads
+    except ValueError:
+        pass
+
+    try:
+        import psutil
+        cores = psutil.cpu_count(logical=False)
+    except ImportError:
+        cores = None
+    return cores or os.cpu_count() or 4
+
+
+# Sprachausgabe: Stimme und Rate werden einmal beim Start festgelegt
+SAY_VOICE = "Anna"
+SAY_RATE = 200
+
+# Optional: Sprachausgabe im Prozess über NSSpeechSynthesizer (PyObjC),
+# sonst ein `say`-Aufruf pro Antwort
+try:
+    from AppKit import NSSpeechSynthesizer
+except ImportError:
+    NSSpeechSynthesizer = None
+
+WhisperModel = None
+if WHISPER_MODEL:
+    WHISPER_THREADS = _whisper_threads()
+    # Threads fest vorgeben, bevor CTranslate2 geladen wird (kein Oversubscription
+    # mit dem PyAudio-Callback-Thread)
+    os.environ.setdefault("OMP_NUM_THREADS", str(WHISPER_THREADS))
+    try:
+        from faster_whisper import WhisperModel
+    except ImportError:
+        print("⚠️  faster-whisper nicht installiert - nutze Google Spracherkennung")
+
 
 class SiriAssistant:
     """
@@ -42,10 +94,10 @@ class SiriAssistant:
     """
 
     # Wake words die den Assistenten aktivieren
-    WAKE_WORDS = ["siri"]
+    WAKE_WORDS = ("siri",)
 
     # Stopp-Wörter zum Beenden
-    STOP_WORDS = ["stop", "beenden", "aufhören", "tschüss", "quit", "exit"]
+    STOP_WORDS = ("stop", "beenden", "aufhören", "tschüss", "quit", "exit")
 
     AGENTS = {
         "supervisor": "emir",
@@ -58,6 +110,17 @@ class SiriAssistant:
         "docs": "docs"
     }
 
+    # Trigger-Wörter pro Agent (einmal pro Klasse statt pro Befehl aufgebaut)
+    AGENT_TRIGGERS = {
+        "coder": ("coder", "programmierer", "entwickler"),
+        "designer": ("designer", "design"),
+        "tester": ("tester", "test"),
+        "planner": ("planner", "planer", "planung"),
+        "berater": ("berater", "beratung", "experte"),
+        "security": ("security", "sicherheit"),
+        "docs": ("docs", "dokumentation", "doku")
+    }
+
     def __init__(self):
         self.recognizer = sr.Recognizer()
         self.microphone = sr.Microphone()
@@ -65,26 +128,81 @@ class SiriAssistant:
             base_url="http://localhost:3001",
             ws_url="ws://localhost:3001/ws"
         )
+        # Einmal verbinden; danach nur nach einem Fehler erneut prüfen
+        self.connected = self.client.connect()
+        atexit.register(self.client.close)
         self.current_agent = "emir"
         self.running = False
         self.listening_for_command = False
 
+        # Sprachausgabe: NSSpeechSynthesizer im Prozess, sonst `say` pro Antwort
+        self._synth = None
+        self._say_voice = None
+        self._start_say(SAY_VOICE)
+
+        # Lokales Whisper-Modell (optional, int8 auf der CPU)
+        self.whisper = None
+        if WhisperModel is not None:
+            print(f"🧠 Lade Whisper-Modell '{WHISPER_MODEL}' ({WHISPER_COMPUTE_TYPE})...")
+            self.whisper = WhisperModel(
+                WHISPER_MODEL,
+                device="cpu",
+                compute_type=WHISPER_COMPUTE_TYPE,
+                cpu_threads=WHISPER_THREADS
+            )
+            self._warm_up_whisper()
+
         # Mikrofonkalibrierung
         print("🎤 Mikrofon wird kalibriert...")
         with self.microphone as source:
             self.recognizer.adjust_for_ambient_noise(source, duration=1)
         print("✅ Mikrofon bereit!")
 
-    def speak(self, text: str, voice: str = "Anna"):
+    def _start_say(self, voice: str):
+        """
+        Bereitet die Sprachausgabe mit fester Stimme und Rate vor
+
+        Bevorzugt einen NSSpeechSynthesizer im Prozess (kein Prozessstart pro
+        Antwort). Ohne PyObjC oder unbekannte Stimme: ein `say`-Aufruf pro
+        Antwort (`say` liest eine Pipe bis EOF, ein dauerhafter Prozess würde
+        erst beim Beenden sprechen).
+        """
+        self._stop_say()
+        self._say_voice = voice
+
+        if NSSpeechSynthesizer is not None:
+            voice_id = self._voice_identifier(voice)
+            if voice_id is not None:
+                self._synth = NSSpeechSynthesizer.alloc().initWithVoice_(voice_id)
+                self._synth.setRate_(SAY_RATE)
+
+    @staticmethod
+    def _voice_identifier(voice: str):
+        """Sucht die NSSpeechSynthesizer-ID zu einem Stimmennamen (z.B. "Anna")"""
+        for voice_id in NSSpeechSynthesizer.availableVoices():
+            attributes = NSSpeechSynthesizer.attributesForVoice_(voice_id)
+            if attributes.get("VoiceName") == voice:
+                return voice_id
+        return None
+
+    def _stop_say(self):
+        """Beendet die Sprachausgabe über den Synthesizer"""
+        if self._synth is not None:
+            self._wait_for_synth(timeout=60)
+            self._synth = None
+
+    def _wait_for_synth(self, timeout: float = 60):
+        """Wartet bis der Synthesizer zu Ende gesprochen hat"""
+        deadline = time.monotonic() + timeout
+        while self._synth.isSpeaking() and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+    def speak(self, text: str, voice: str = SAY_VOICE):
         """Text über macOS Sprachausgabe vorlesen"""
         try:
             # Bereinige Text für Sprachausgabe
+            # (keine Shell beteiligt - Anführungszeichen müssen nicht entfernt werden)
             clean_text = str(text)
-            # Entferne problematische Zeichen
-            clean_text = clean_text.replace('"', ' ')
-            clean_text = clean_text.replace("'", ' ')
-            clean_text = clean_text.replace('`', ' ')
-            clean_text = clean_text.replace('\\', ' ')
             clean_text = clean_text.replace('\n', '. ')
             clean_text = clean_text.replace('\r', ' ')
             # Kürze für Sprachausgabe
@@ -92,8 +210,20 @@ class SiriAssistant:
                 clean_text = clean_text[:500] + "... und so weiter."
 
             print(f"🔊 Spreche: {clean_text[:50]}...")
+            if voice != self._say_voice:
+                self._start_say(voice)
+
+            if self._synth is not None:
+                # startSpeakingString_ kehrt sofort zurück - warten bis zu Ende
+                # gesprochen wurde, sonst nimmt listen() die eigene Antwort auf
+                self._synth.startSpeakingString_(clean_text)
+                self._wait_for_synth()
+                return
+
+            # Text über stdin statt als Argument: beginnt er mit "-", wäre er eine Option
             result = subprocess.run(
-                ["say", "-v", voice, clean_text],
+                ["say", "-v", voice, "-r", str(SAY_RATE)],
+                input=clean_text,
                 capture_output=True,
                 text=True,
                 timeout=60
@@ -122,6 +252,9 @@ class SiriAssistant:
                     phrase_time_limit=phrase_limit
                 )
 
+            if self.whisper is not None:
+                return self.transcribe_local(audio).lower()
+
             # Google Speech Recognition (kostenlos)
             text = self.recognizer.recognize_google(audio, language="de-DE")
             return text.lower()
@@ -137,48 +270,65 @@ class SiriAssistant:
             print(f"⚠️  Fehler: {e}")
             return ""
 
+    def _warm_up_whisper(self):
+        """
+        Einmal eine Sekunde Stille transkribieren, damit die erste
+        Aktivierung nicht die Initialisierungskosten des Modells bezahlt
+        """
+        import numpy as np
+
+        segments, _ = self.whisper.transcribe(
+            np.zeros(16000, dtype=np.float32), language="de", beam_size=1
+        )
+        # transcribe() ist lazy - erst das Iterieren rechnet wirklich
+        for _ in segments:
+            pass
+
+    def transcribe_local(self, audio) -> str:
+        """
+        Transkribiert Audio lokal mit dem int8-Whisper-Modell
+
+        Args:
+            audio: sr.AudioData aus listen()
+
+        Returns:
+            Erkannter Text oder leerer String
+        """
+        import numpy as np
+
+        # Whisper erwartet 16 kHz Mono als float32 im Bereich [-1, 1]
+        raw = audio.get_raw_data(convert_rate=16000, convert_width=2)
+        samples = np.frombuffer(raw, dtype=np.int16).astype(np.float32) / 32768.0
+
+        segments, _ = self.whisper.transcribe(samples, language="de", beam_size=1)
+        return " ".join(segment.text.strip() for segment in segments).strip()
+
     def check_wake_word(self, text: str) -> bool:
         """Prüft ob ein Wake Word erkannt wurde"""
         text_lower = text.lower()
-        for wake_word in self.WAKE_WORDS:
-            if wake_word in text_lower:
-                return True
-        return False
+        return any(wake_word in text_lower for wake_word in self.WAKE_WORDS)
 
     def check_stop_word(self, text: str) -> bool:
         """Prüft ob ein Stopp-Wort erkannt wurde"""
         text_lower = text.lower()
-        for stop_word in self.STOP_WORDS:
-            if stop_word in text_lower:
-                return True
-        return False
+        return any(stop_word in text_lower for stop_word in self.STOP_WORDS)
 
     def extract_agent_from_text(self, text: str) -> tuple:
         """
         Extrahiert Agent aus Text
         z.B. "frag den coder wie..." → ("coder", "wie...")
         """
-        text_lower = text.lower()
-
-        agent_triggers = {
-            "coder": ["coder", "programmierer", "entwickler"],
-            "designer": ["designer", "design"],
-            "tester": ["tester", "test"],
-            "planner": ["planner", "planer", "planung"],
-            "berater": ["berater", "beratung", "experte"],
-            "security": ["security", "sicherheit"],
-            "docs": ["docs", "dokumentation", "doku"]
-        }
-
-        for agent, triggers in agent_triggers.items():
-            for trigger in triggers:
-                if trigger in text_lower:
-                    # Entferne den Trigger aus dem Text
-                    for t in triggers:
-                        text = text.lower().replace(f"frag den {t}", "")
-                        text = text.lower().replace(f"frage den {t}", "")
-                        text = text.lower().replace(t, "")
-                    return (agent, text.strip())
+        text_folded = text.casefold()
+
+        for agent, triggers in self.AGENT_TRIGGERS.items():
+            if any(trigger in text_folded for trigger in triggers):
+                # Entferne den Trigger aus dem Text
+                text = text.lower()
+                for t in triggers:
+                    text = text.replace(f"frag den {t}", "")
+                    text = text.replace(f"frage den {t}", "")
+                    text = text.replace(t, "")
+                return (agent, text.strip())
 
         return (None, text)
 
@@ -186,8 +336,10 @@ class SiriAssistant:
         """Frage an das Backend senden"""
         agent_name = agent if agent else self.current_agent
 
-        if not self.client.connect():
-            return "Das Backend ist leider nicht erreichbar. Bitte starte zuerst den Server."
+        if not self.connected:
+            self.connected = self.client.connect()
+            if not self.connected:
+                return "Das Backend ist leider nicht erreichbar. Bitte starte zuerst den Server."
 
         result = self.client.send_chat_message(
             message=question,
@@ -200,6 +352,9 @@ class SiriAssistant:
             response = data.get("content") or data.get("response") or data.get("message")
             return response if response else "Ich habe leider keine Antwort erhalten."
         else:
+            # Verbindung bei der nächsten Frage neu prüfen (kein automatisches
+            # Wiederholen - die Nachricht kann schon angekommen sein)
+            self.connected = False
             return f"Es gab einen Fehler: {result.get('error', 'Unbekannt')}"
 
     def handle_command(self, text: str):
@@ -214,7 +369,8 @@ class SiriAssistant:
 
         # Prüfe auf spezielle Befehle
         if "status" in text.lower():
-            if self.client.connect():
+            self.connected = self.client.connect()
+            if self.connected:
                 self.speak("Ich bin bereit und das Backend ist verbunden.")
             else:
                 self.speak("Das Backend ist nicht erreichbar.")
@@ -318,6 +474,7 @@ class SiriAssistant:
                 print(f"⚠️  Fehler: {e}")
                 time.sleep(1)
 
+        self._stop_say()
         print("✅ Siri beendet.")
 
 
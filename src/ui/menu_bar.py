@@ -12,8 +12,10 @@ import threading
 import os
 import sys
 
-# Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+# Add project root to path - only when run as a script (imported via the
+# `src` package, e.g. from menu_bar_launcher.py, it is already importable)
+if "src" not in sys.modules:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from src.core import SuperMacAssistant
 from src.agents.agent_identity import AgentType
@@ -33,6 +35,9 @@ class SuperMacMenuBarApp(rumps.App):
     # OTOP Accessibility ID prefix
     ACCESSIBILITY_PREFIX = "supermac.menubar"
 
+    # Seconds between coalesced status refreshes
+    REFRESH_INTERVAL = 2.0
+
     def __init__(self):
         # Initialize with robot icon
         super().__init__(
@@ -45,6 +50,16 @@ class SuperMacMenuBarApp(rumps.App):
         # Initialize assistant in background
         self.assistant = None
         self.loading = True
+        self._init_error = None  # Shown by _tick (background thread must not touch the UI)
+
+        # Last title written per item (skip no-op writes across the Cocoa bridge)
+        self._last_titles = {}
+
+        # State changes only set the dirty flag; the timer refreshes the menu
+        # on the main thread, coalescing rapid changes into one update
+        self._dirty = False
+        self._refresh_timer = rumps.Timer(self._tick, self.REFRESH_INTERVAL)
+        self._refresh_timer.start()
 
         # Build menu
         self._build_menu()
@@ -168,35 +183,51 @@ class SuperMacMenuBarApp(rumps.App):
         try:
             self.assistant = SuperMacAssistant()
             self.loading = False
-            self._update_status()
+            self._dirty = True
         except Exception as e:
-            self.status_item.title = f"Error: {str(e)[:30]}"
+            self._init_error = f"Error: {str(e)[:30]}"
             self.loading = False
+            self._dirty = True
+
+    def _set(self, item, title: str):
+        """Set item.title (menu item or the app itself) only if it changed"""
+        key = id(item)
+        if self._last_titles.get(key) != title:
+            item.title = title
+            self._last_titles[key] = title
+
+    def _tick(self, sender):
+        """Timer callback: refresh the status displays if anything changed"""
+        if self._dirty:
+            self._dirty = False
+            self._update_status()
 
     def _update_status(self):
         """Update all status displays"""
         if not self.assistant:
+            if self._init_error:
+                self._set(self.status_item, self._init_error)
             return
 
         # Update status
-        self.status_item.title = "Status: Ready"
-        self.title = "🤖" if self.assistant.backend_available else "🔴"
+        self._set(self.status_item, "Status: Ready")
+        self._set(self, "🤖" if self.assistant.backend_available else "🔴")
 
         # Update agent
         agent = self.assistant.get_current_agent()
-        self.current_agent_item.title = f"Current: {agent.short_name}"
+        self._set(self.current_agent_item, f"Current: {agent.short_name}")
 
         # Update backend status
         if self.assistant.backend_available:
-            self.backend_status_item.title = "Backend: Connected"
+            self._set(self.backend_status_item, "Backend: Connected")
         else:
-            self.backend_status_item.title = "Backend: Offline"
+            self._set(self.backend_status_item, "Backend: Offline")
 
         # Update Slack
         if self.assistant.slack_enabled:
-            self.slack_toggle_item.title = "Notifications: On"
+            self._set(self.slack_toggle_item, "Notifications: On")
         else:
-            self.slack_toggle_item.title = "Notifications: Off"
+            self._set(self.slack_toggle_item, "Notifications: Off")
 
     # ===== Menu Callbacks =====
 
@@ -214,7 +245,7 @@ class SuperMacMenuBarApp(rumps.App):
 
         result = self.assistant.switch_agent("supervisor")
         if result.get("success"):
-            self._update_status()
+            self._dirty = True
             rumps.notification(
                 title="Super Mac Assistant",
                 subtitle="Agent Switched",
@@ -230,7 +261,7 @@ class SuperMacMenuBarApp(rumps.App):
 
         result = self.assistant.switch_agent("assistant")
         if result.get("success"):
-            self._update_status()
+            self._dirty = True
             rumps.notification(
                 title="Super Mac Assistant",
                 subtitle="Agent Switched",
@@ -287,12 +318,12 @@ Slack: {'Enabled' if status.get('slack_enabled') else 'Disabled'}
         if not self.assistant:
             return
 
-        self.backend_status_item.title = "Backend: Connecting..."
+        self._set(self.backend_status_item, "Backend: Connecting...")
 
         def reconnect():
             if self.assistant.backend.connect():
                 self.assistant.backend_available = True
-                self._update_status()
+                self._dirty = True
                 rumps.notification(
                     title="Super Mac Assistant",
                     subtitle="Backend",
@@ -301,7 +332,7 @@ Slack: {'Enabled' if status.get('slack_enabled') else 'Disabled'}
                 )
             else:
                 self.assistant.backend_available = False
-                self._update_status()
+                self._dirty = True
                 rumps.notification(
                     title="Super Mac Assistant",
                     subtitle="Backend",
@@ -323,7 +354,7 @@ Slack: {'Enabled' if status.get('slack_enabled') else 'Disabled'}
         else:
             self.assistant.enable_slack_notifications()
 
-        self._update_status()
+        self._dirty = True
 
     @rumps.clicked("Quit Super Mac Assistant")
     def quit_app(self, sender):
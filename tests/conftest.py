@@ -0,0 +1,98 @@
+"""
+Shared pytest fixtures
+
+Session-scoped: policy.yaml is parsed and the audit log opened once per
+worker instead of once per test.
+"""
+
+import functools
+import os
+import sys
+from pathlib import Path
+
+import pytest
+import requests
+import yaml
+from requests.adapters import HTTPAdapter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from executor.validator import PolicyValidator
+from executor.executor import ActionExecutor
+from src.security.audit_log import AuditLogger
+from src.security.finance_guard import FinanceGuard
+
+# policy.yaml of this checkout (no dependency on a fixed home directory layout)
+POLICY_PATH = Path(__file__).resolve().parents[1] / "policy" / "policy.yaml"
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-integration", action="store_true", default=False,
+        help="run the live backend tests (marked backend)"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Live backend tests are opt-in; the mocked contract tests always run"""
+    if config.getoption("--run-integration"):
+        return
+
+    skip_live = pytest.mark.skip(reason="live backend test (use --run-integration)")
+    for item in items:
+        if "backend" in item.keywords:
+            item.add_marker(skip_live)
+
+
+# libyaml's C loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=4)
+def _load(path: str, mtime_ns: int):
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+
+def load_policy(path: str):
+    """Parse a policy file once per (path, mtime)"""
+    return _load(path, os.stat(path).st_mtime_ns)
+
+
+@pytest.fixture(scope="session")
+def policy():
+    """Parsed policy.yaml"""
+    return load_policy(str(POLICY_PATH))
+
+
+@pytest.fixture(scope="session")
+def validator():
+    return PolicyValidator(policy_path=str(POLICY_PATH))
+
+
+@pytest.fixture(scope="session")
+def audit_logger(tmp_path_factory):
+    """Audit logger writing to a temp directory of its own per xdist worker"""
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    logger = AuditLogger(log_dir=str(tmp_path_factory.mktemp(f"audit_{worker}")))
+    yield logger
+    logger.close()
+
+
+@pytest.fixture(scope="session")
+def http_session():
+    """Pooled keep-alive session for every backend call of a worker"""
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0))
+    yield session
+    session.close()
+
+
+@pytest.fixture(scope="session")
+def executor(validator, audit_logger, http_session):
+    return ActionExecutor(validator, audit_logger, http_session=http_session)
+
+
+@pytest.fixture(scope="session")
+def finance_guard(policy):
+    return FinanceGuard(policy['finance_guard'])
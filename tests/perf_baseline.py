@@ -0,0 +1,57 @@
+"""
+Performance baseline for the per-request hot paths (pytest-benchmark)
+
+Manual only - not part of CI: timings on shared runners are too noisy for a
+10% threshold, and the saved baselines are machine-specific. Not collected by
+the default run (no test_ prefix). Run in-process, without xdist workers, so
+the timings are not skewed by parallel tests:
+
+    pytest tests/perf_baseline.py -n 0 --benchmark-autosave
+    pytest tests/perf_baseline.py -n 0 --benchmark-compare --benchmark-compare-fail=mean:10%
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+
+# Repository path of the git action cases (schema, FinanceGuard and path checks)
+REPO_PATH = '/Users/dsselmanovic/activi-dev-repos/super-mac-assistant'
+
+
+def _validate_uncached(validator, action, args):
+    """Full validation without the decision cache (measures every check)"""
+    validator._decision_cache.clear()
+    return validator.validate_action(action, args)
+
+
+def test_bench_validator(benchmark, validator):
+    result = benchmark(_validate_uncached, validator, 'status_overview', {})
+    assert result.result.value == "allowed"
+
+
+def test_bench_validator_paths(benchmark, validator):
+    result = benchmark(_validate_uncached, validator, 'git_push', {'repo_path': REPO_PATH})
+    assert result.result.value == "pending_confirmation"
+
+
+def test_bench_validator_cached(benchmark, validator):
+    validator.validate_action('status_overview', {})
+    result = benchmark(validator.validate_action, 'status_overview', {})
+    assert result.result.value == "allowed"
+
+
+def test_bench_check_keyword(benchmark, finance_guard):
+    is_finance, _ = benchmark(
+        finance_guard.access_detector.check_keyword,
+        "Create a task to review the sprint board"
+    )
+    assert not is_finance
+
+
+def test_bench_check_domain(benchmark, finance_guard):
+    is_finance, _ = benchmark(
+        finance_guard.access_detector.check_domain,
+        "https://github.com/dsactivi-2/super-mac-assistant"
+    )
+    assert not is_finance
@@ -0,0 +1,68 @@
+"""
+ActionAllowlist: lookup tables, frequency limits and batch validation
+"""
+
+from time import monotonic
+
+from src.security.action_allowlist import ActionAllowlist, AllowedAction, RiskLevel
+
+
+def test_validate_action():
+    allowlist = ActionAllowlist()
+
+    result = allowlist.validate_action("take_screenshot", {})
+    assert result["allowed"] and not result["requires_confirmation"]
+    assert result["risk_level"] == "low"
+
+    result = allowlist.validate_action("open_vscode", {})
+    assert result["allowed"] and result["requires_confirmation"]
+
+    assert not allowlist.validate_action("run_shell_command", {"command": "ls"})["allowed"]
+    assert "not in allowlist" in allowlist.validate_action("format_disk", {})["reason"]
+
+
+def test_unknown_actions_are_blocked():
+    allowlist = ActionAllowlist()
+
+    assert not allowlist.is_allowed("format_disk")
+    assert allowlist.is_blocked("format_disk")
+    assert allowlist.requires_confirmation("format_disk")
+    assert allowlist.get_risk_level("format_disk") == RiskLevel.CRITICAL
+
+
+def test_missing_params_sorted():
+    allowlist = ActionAllowlist()
+
+    result = allowlist.validate_action("create_github_issue", {})
+    assert not result["allowed"]
+    assert result["reason"] == "Missing required parameters: ['repo', 'title']"
+
+    assert allowlist.validate_action("create_github_issue", {"repo": "r", "title": "t"})["allowed"]
+
+
+def test_requires_params_frozen():
+    action = AllowedAction("a", RiskLevel.LOW, "test", requires_params=["x", "x", "y"])
+    assert action.requires_params == frozenset({"x", "y"})
+
+
+def test_frequency_limit():
+    allowlist = ActionAllowlist()  # restart_backend: max 5 per hour
+    for _ in range(5):
+        allowlist.log_execution("restart_backend", True)
+
+    result = allowlist.validate_action("restart_backend", {})
+    assert not result["allowed"]
+    assert result["reason"] == "Frequency limit exceeded: 5/5 per hour"
+
+    # Executions older than one hour no longer count (and are dropped)
+    assert allowlist._count_recent_executions("restart_backend", monotonic() + 3601) == 0
+    assert allowlist.validate_action("restart_backend", {})["allowed"]
+
+
+def test_validate_many():
+    allowlist = ActionAllowlist()
+    candidates = [("take_screenshot", {}), ("sudo_command", {}), ("create_task", {"title": "t"})]
+
+    results = allowlist.validate_many(candidates)
+    assert [r["allowed"] for r in results] == [True, False, True]
+    assert results == [allowlist.validate_action(name, params) for name, params in candidates]
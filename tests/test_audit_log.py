@@ -0,0 +1,278 @@
+"""
+AuditLogger: background flusher, rotation, statistics, search and report
+"""
+
+import gzip
+import os
+import shutil
+import threading
+import time
+
+import pytest
+
+from src.security import audit_log as audit_log_module
+from src.security.audit_log import AuditLogger
+
+
+def _log(logger, action="status_overview", success=True, agent="assistant"):
+    logger.log_action(
+        action=action, agent=agent, trigger="test", params={},
+        result={"success": success}, risk_level="low"
+    )
+
+
+def _call_with_timeout(func, timeout=5):
+    """Run func in a thread; fail instead of hanging the test run"""
+    result = []
+    thread = threading.Thread(target=lambda: result.append(func()), daemon=True)
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive(), f"{func.__name__} did not return within {timeout}s"
+    return result[0]
+
+
+def test_flusher_writes_all_entries(tmp_path):
+    logger = AuditLogger(log_dir=str(tmp_path))
+    for i in range(AuditLogger.FLUSH_BATCH_SIZE + 10):
+        _log(logger, action=f"action_{i}")
+
+    logs = logger.get_recent_logs()
+    logger.close()
+
+    assert len(logs) == AuditLogger.FLUSH_BATCH_SIZE + 10
+    assert logs[0]["result"]["success"] is True
+
+
+def test_log_after_close_is_written(tmp_path):
+    logger = AuditLogger(log_dir=str(tmp_path))
+    _log(logger, action="before_close")
+    logger.close()
+
+    _log(logger, action="after_close")
+    logger.log_security_event("blocked_action", "after close")
+    logger.close()  # Second close (atexit) is a no-op
+
+    logs = _call_with_timeout(logger.get_recent_logs)
+    assert {log.get("action") for log in logs} >= {"before_close", "after_close"}
+    assert any(log.get("type") == "security_event" for log in logs)
+
+
+def test_rotation_compresses_previous_day(tmp_path):
+    logger = AuditLogger(log_dir=str(tmp_path))
+    _log(logger)
+    logger.flush()
+
+    today_file = logger.current_log_file
+    with logger._lock:
+        logger._rotate(logger._log_day + 1)
+
+    gz_file = today_file.with_name(today_file.name + ".gz")
+    deadline = time.monotonic() + 5
+    while today_file.exists() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert not today_file.exists()
+    with gzip.open(gz_file, "rb") as f:
+        assert b'"action":' in f.read()
+
+    # Readers fall back to the compressed file
+    assert len(logger.get_recent_logs()) == 1
+    logger.close()
+
+
+def test_stats(tmp_path):
+    logger = AuditLogger(log_dir=str(tmp_path))
+    _log(logger, agent="assistant")
+    _log(logger, agent="assistant", success=False)
+    _log(logger, agent="supervisor")
+    logger.log_security_event("blocked_action", "test")
+
+    stats = logger.get_stats()
+    logger.close()
+
+    assert stats["total_actions"] == 4
+    assert stats["security_events"] == 1
+    assert stats["by_agent"] == {"assistant": 2, "supervisor": 1, "unknown": 1}
+    assert stats["success_rate"] == 50.0
+
+
+def test_stats_include_other_processes(tmp_path):
+    """Entries another logger (process) appends later are counted too"""
+    logger = AuditLogger(log_dir=str(tmp_path))
+    _log(logger)
+    assert logger.get_stats()["total_actions"] == 1
+
+    other = AuditLogger(log_dir=str(tmp_path))
+    _log(other, agent="supervisor")
+    _log(other, agent="supervisor")
+    other.flush()
+
+    stats = logger.get_stats()
+    assert stats["total_actions"] == 3
+    assert stats["by_agent"] == {"assistant": 1, "supervisor": 2}
+
+    # Nothing is counted twice
+    assert logger.get_stats()["total_actions"] == 3
+    logger.close()
+    other.close()
+
+
+def test_concurrent_compression(tmp_path, monkeypatch, capsys):
+    """Loggers rotating the same day at once leave one valid .gz"""
+    log_file = tmp_path / "audit_20260101.jsonl"
+    content = b"".join(b'{"id": "%s"}\n' % os.urandom(16).hex().encode() for _ in range(5000))
+    log_file.write_bytes(content)
+
+    # All compressions are in progress at the same time
+    barrier = threading.Barrier(4, timeout=5)
+    copyfileobj = shutil.copyfileobj
+
+    def overlapping_copy(src, dst):
+        barrier.wait()
+        copyfileobj(src, dst)
+
+    monkeypatch.setattr(shutil, "copyfileobj", overlapping_copy)
+
+    threads = [
+        threading.Thread(target=AuditLogger._compress_log_file, args=(log_file,))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert "compression failed" not in capsys.readouterr().out
+    assert not log_file.exists()
+    with gzip.open(tmp_path / "audit_20260101.jsonl.gz", "rb") as f:
+        assert f.read() == content
+    assert [p.name for p in tmp_path.iterdir()] == ["audit_20260101.jsonl.gz"]
+
+
+@pytest.fixture(params=["ahocorasick", "substring"])
+def search_backend(request, monkeypatch):
+    """Run multi-term search with the Aho-Corasick automaton and without it"""
+    if request.param == "ahocorasick":
+        pytest.importorskip("ahocorasick")
+    else:
+        monkeypatch.setattr(audit_log_module, "ahocorasick", None)
+    return request.param
+
+
+@pytest.fixture
+def search_logger(tmp_path):
+    logger = AuditLogger(log_dir=str(tmp_path))
+    _log(logger, action="git_status")
+    _log(logger, action="create_task", agent="Supervisor")
+    _log(logger, action="git_push")
+    logger.log_security_event("blocked_action", "Finance path denied")
+    yield logger
+    logger.close()
+
+
+def _actions(logs):
+    return [log.get("action", log.get("type")) for log in logs]
+
+
+def test_search_logs(search_logger):
+    # Newest first
+    assert _actions(search_logger.search_logs("git_")) == ["git_push", "git_status"]
+    # Case-insensitive on both sides
+    assert _actions(search_logger.search_logs("SUPERVISOR")) == ["create_task"]
+    assert _actions(search_logger.search_logs("finance")) == ["security_event"]
+    assert search_logger.search_logs("no such entry") == []
+    assert len(search_logger.search_logs("")) == 4
+
+
+def test_search_logs_decodes_only_hits(search_logger, monkeypatch):
+    """Lines are matched as raw bytes; only hits are parsed"""
+    decoded = []
+    decode = audit_log_module._decode
+    monkeypatch.setattr(audit_log_module, "_decode", lambda line: decoded.append(line) or decode(line))
+
+    assert _actions(search_logger.search_logs("create_task")) == ["create_task"]
+    assert len(decoded) == 1
+
+
+def test_search_logs_multi(search_logger, search_backend):
+    results = search_logger.search_logs_multi(["git_", "Supervisor", "FINANCE", "missing"])
+
+    assert _actions(results["git_"]) == ["git_push", "git_status"]
+    assert _actions(results["Supervisor"]) == ["create_task"]
+    assert _actions(results["FINANCE"]) == ["security_event"]
+    assert results["missing"] == []
+    assert search_logger.search_logs_multi([]) == {}
+
+
+def test_search_logs_multi_matches_search_logs(search_logger, search_backend):
+    """Every query gets what search_logs returns, also for case variants and ''"""
+    queries = ["git_push", "GIT_PUSH", "git", "", "git"]
+    results = search_logger.search_logs_multi(queries)
+
+    assert list(results) == ["git_push", "GIT_PUSH", "git", ""]
+    for query in queries:
+        assert results[query] == search_logger.search_logs(query), query
+
+
+def _report_section(report, title):
+    lines = report.splitlines()
+    start = lines.index(title) + 1
+    return lines[start:lines.index("", start)]
+
+
+def test_export_report(tmp_path):
+    logger = AuditLogger(log_dir=str(tmp_path))
+    for i in range(24):
+        _log(logger, action=f"action_{i}", success=i % 4 != 0,
+             agent="supervisor" if i % 3 == 0 else "assistant")
+    logger.log_security_event("blocked_action", "test")
+
+    report = logger.export_report()
+    logger.close()
+
+    assert "Total Actions: 25" in report
+    assert "Success Rate: 72.0%" in report  # 18 of 25
+    assert "Security Events: 1" in report
+    assert sorted(_report_section(report, "By Risk Level:")) == ["  low: 24", "  unknown: 1"]
+    assert sorted(_report_section(report, "By Agent:")) == [
+        "  assistant: 16", "  supervisor: 8", "  unknown: 1"
+    ]
+
+    # The 20 newest entries, newest first
+    recent = report.split("RECENT ACTIONS\n" + "-" * 60 + "\n")[1].splitlines()[:-2]
+    assert [line.rsplit(" | ", 1)[1] for line in recent] == (
+        ["unknown"] + [f"action_{i}" for i in range(23, 4, -1)]
+    )
+    assert recent[1].split(" | ")[1:] == ["✅", "assistant", "action_23"]
+    assert recent[4].split(" | ")[1:] == ["❌", "assistant", "action_20"]
+    assert recent[12].split(" | ")[1:] == ["❌", "supervisor", "action_12"]
+
+
+def test_binary_log_is_read_back(tmp_path):
+    """With binary_log=True readers use the msgpack sidecar, not the JSONL file"""
+    pytest.importorskip("msgpack")
+    logger = AuditLogger(log_dir=str(tmp_path), binary_log=True)
+    _log(logger, action="git_status", success=False)
+    logger.log_security_event("blocked_action", "test", severity="warning")
+    logger.flush()
+
+    sidecar = logger.current_log_file.with_suffix(".mpk")
+    assert sidecar.stat().st_size > 0
+
+    # Same entries and layout as the JSONL file
+    logs = logger.get_recent_logs()
+    json_reader = AuditLogger(log_dir=str(tmp_path))
+    assert logs == json_reader.get_recent_logs()
+    json_reader.close()
+    assert _actions(logs) == ["security_event", "git_status"]
+    assert logs[1]["result"]["success"] is False
+
+    # Drop the JSONL file: the binary reader must not need it
+    logger.current_log_file.write_bytes(b"")
+    assert logger.get_recent_logs() == logs
+
+    report = logger.export_report()
+    logger.close()
+    assert "Total Actions: 2" in report
+    assert "Security Events: 1" in report
+    assert "| ❌ | assistant | git_status" in report
@@ -0,0 +1,148 @@
+"""
+Backend Contract Tests
+Executor ↔ BackendAPIClient wiring against a mocked backend (no network)
+
+The live counterparts are in test_backend_integration.py (--run-integration).
+"""
+
+import json
+
+import requests
+import responses
+
+from executor.executor import ActionExecutor
+
+BACKEND_URL = "http://localhost:3000"
+
+
+@responses.activate
+def test_backend_health_contract(executor):
+    """Healthy /health maps to status 'healthy'"""
+    responses.add(responses.GET, f"{BACKEND_URL}/health", json={"status": "ok"}, status=200)
+
+    result = executor.execute('check_backend_health', {}, trigger='test', agent='test')
+
+    assert result['success']
+    assert result['status'] == 'healthy'
+
+
+@responses.activate
+def test_backend_unreachable_contract(executor):
+    """Connection errors map to status 'unreachable'"""
+    responses.add(responses.GET, f"{BACKEND_URL}/health", body=ConnectionError("refused"))
+
+    result = executor.execute('check_backend_health', {}, trigger='test', agent='test')
+
+    assert not result['success']
+    assert result['status'] == 'unreachable'
+
+
+@responses.activate
+def test_create_task_contract(executor):
+    """create_task POSTs the task fields to /api/tasks"""
+    responses.add(
+        responses.POST, f"{BACKEND_URL}/api/tasks",
+        json={"id": "t1", "title": "Contract task"}, status=201
+    )
+
+    result = executor.execute('create_task', {
+        'title': 'Contract task',
+        'description': 'Mocked',
+        'priority': 'medium',
+        'assignee': 'cloud_assistant'
+    }, trigger='test', agent='test')
+
+    assert result['success']
+    assert result['task']['data']['id'] == 't1'
+
+    payload = json.loads(responses.calls[0].request.body)
+    assert payload == {
+        'title': 'Contract task',
+        'description': 'Mocked',
+        'priority': 'medium',
+        'assignee': 'cloud_assistant'
+    }
+
+
+@responses.activate
+def test_list_tasks_contract(executor):
+    """list_tasks with status 'all' sends no status filter"""
+    responses.add(
+        responses.GET, f"{BACKEND_URL}/api/tasks",
+        json=[{"id": "t1"}, {"id": "t2"}], status=200
+    )
+
+    result = executor.execute('list_tasks', {'status': 'all'}, trigger='test', agent='test')
+
+    assert result['success']
+    assert result['count'] == 2
+    assert 'status=' not in responses.calls[0].request.url
+
+
+@responses.activate
+def test_send_chat_message_contract(executor):
+    """send_chat_message POSTs message and agent name to /api/chat/send"""
+    responses.add(
+        responses.POST, f"{BACKEND_URL}/api/chat/send",
+        json={"response": "Hallo!"}, status=200
+    )
+
+    result = executor.execute('send_chat_message', {
+        'agent': 'emir',
+        'message': 'Hello from the contract test'
+    }, trigger='test', agent='test')
+
+    assert result['success']
+    assert result['agent'] == 'emir'
+
+    payload = json.loads(responses.calls[0].request.body)
+    assert payload['message'] == 'Hello from the contract test'
+    assert payload['agentName'] == 'emir'
+
+
+@responses.activate
+def test_status_overview_contract(executor):
+    """status_overview reports the backend health"""
+    responses.add(responses.GET, f"{BACKEND_URL}/health", json={"status": "ok"}, status=200)
+
+    result = executor.execute('status_overview', {}, trigger='test', agent='test')
+
+    assert result['success']
+    assert result['backend'] == 'healthy'
+
+
+@responses.activate
+def test_executor_owns_one_session(validator, audit_logger, monkeypatch):
+    """Without an injected session every action reuses one executor-owned session"""
+    responses.add(responses.GET, f"{BACKEND_URL}/health", json={"status": "ok"}, status=200)
+    executor = ActionExecutor(validator, audit_logger)
+
+    closed = []
+    monkeypatch.setattr(executor.http_session, 'close', lambda: closed.append(True))
+    sessions = []
+    session_init = requests.Session.__init__
+
+    def tracking_init(self, *args, **kwargs):
+        sessions.append(self)
+        session_init(self, *args, **kwargs)
+
+    monkeypatch.setattr(requests.Session, '__init__', tracking_init)
+
+    for _ in range(3):
+        assert executor.execute('check_backend_health', {}, trigger='test', agent='test')['success']
+
+    assert sessions == []
+    executor.close()
+    assert closed == [True]
+
+
+def test_executor_keeps_injected_session_open(validator, audit_logger, http_session, monkeypatch):
+    """An injected session belongs to the caller and is not closed"""
+    closed = []
+    monkeypatch.setattr(http_session, 'close', lambda: closed.append(True))
+
+    executor = ActionExecutor(validator, audit_logger, http_session=http_session)
+    executor.close()
+
+    assert executor.http_session is http_session
+    assert closed == []
@@ -0,0 +1,168 @@
+"""
+FinanceAccessDetector: deny path trie and deny list matchers
+FinanceGuard: cached mount state never hides a mounted volume
+"""
+
+import os
+import subprocess
+from types import SimpleNamespace
+
+import pytest
+
+from src.security import finance_guard as finance_guard_module
+from src.security.audit_log import AuditLogger
+from src.security.finance_guard import FinanceAccessDetector, FinanceGuard
+
+CONFIG = {
+    'deny_paths': ["/Volumes/Finance", "~/Banking"],
+    'deny_keywords': ["invoice", "bank", "banking"],
+    'deny_apps': ["Banking", "Lexoffice"],
+    'deny_domains': ["paypal.com", "pay.com"],
+}
+
+
+@pytest.fixture(params=["ahocorasick", "regex"])
+def matcher_backend(request, monkeypatch):
+    """Run with the Aho-Corasick matcher and with the regex fallback"""
+    if request.param == "ahocorasick":
+        pytest.importorskip("ahocorasick")
+    else:
+        monkeypatch.setattr(finance_guard_module, "ahocorasick", None)
+    return request.param
+
+
+@pytest.fixture
+def detector(matcher_backend):
+    return FinanceAccessDetector(CONFIG)
+
+
+@pytest.mark.parametrize("path,expected", [
+    ("/Volumes/Finance", "/Volumes/Finance"),
+    ("/Volumes/Finance/2026/report.pdf", "/Volumes/Finance"),
+    ("/Volumes/Finance/", "/Volumes/Finance"),
+    ("/Volumes/Other/../Finance/data", "/Volumes/Finance"),
+    ("/Volumes//Finance/./data", "/Volumes/Finance"),
+    ("//Volumes/Finance/data", "/Volumes/Finance"),
+    ("~/Banking/statement.csv", "~/Banking"),
+    (os.path.expanduser("~/Banking"), "~/Banking"),
+    ("/Volumes/FinanceBackup/data", None),
+    ("/Volumes/Finance/../Public", None),
+    ("/Volumes", None),
+], ids=["exact", "below", "trailing_slash", "dotdot_into", "double_slash", "leading_double_slash",
+        "tilde", "expanded_home", "component_prefix", "dotdot_out_of", "parent"])
+def test_check_path_access(detector, path, expected):
+    is_finance, matched = detector.check_path_access(path)
+    assert is_finance == (expected is not None)
+    assert matched == expected
+
+
+def test_check_path_access_relative(detector, tmp_path, monkeypatch):
+    """Relative paths are resolved against the working directory"""
+    monkeypatch.chdir(tmp_path)
+    relative = os.path.relpath("/Volumes/Finance/data", tmp_path)
+    assert relative.startswith("..")
+
+    assert detector.check_path_access(relative) == (True, "/Volumes/Finance")
+    assert detector.check_path_access("Volumes/Finance/data") == (False, None)
+
+
+def test_check_path_access_symlink(tmp_path):
+    """A symlink into a deny path is blocked like the deny path itself"""
+    finance = tmp_path / "Finance"
+    finance.mkdir()
+    (tmp_path / "alias").symlink_to(finance)
+
+    detector = FinanceAccessDetector({'deny_paths': [str(finance)]})
+    assert detector.check_path_access(str(tmp_path / "alias" / "data")) == (True, str(finance))
+
+
+@pytest.mark.parametrize("check,value,expected", [
+    # First match in list order, not in text order
+    ('check_keyword', "Bank transfer for the invoice", "invoice"),
+    ('check_keyword', "Online BANKING", "bank"),
+    ('check_keyword', "Review the sprint board", None),
+    ('check_app', "Lexoffice Banking", "Banking"),
+    ('check_app', "Visual Studio Code", None),
+    ('check_domain', "https://www.PayPal.com/checkout", "paypal.com"),
+    ('check_domain', "https://pay.com/?next=paypal.com", "paypal.com"),
+    ('check_domain', "https://github.com", None),
+], ids=["keyword_list_order", "keyword_case", "keyword_clean", "app_list_order",
+        "app_clean", "domain_case", "domain_list_order", "domain_clean"])
+def test_deny_list_priority(detector, check, value, expected):
+    is_finance, matched = getattr(detector, check)(value)
+    assert is_finance == (expected is not None)
+    assert matched == expected
+
+
+@pytest.mark.parametrize("keywords,expected", [
+    ([""], ""),
+    (["invoice", ""], ""),
+    (["", "hello"], ""),
+], ids=["only_empty", "empty_last", "empty_first"])
+def test_empty_deny_entry(matcher_backend, keywords, expected):
+    """An empty entry matches anything - the same with both backends"""
+    detector = FinanceAccessDetector({'deny_keywords': keywords})
+    assert detector.check_keyword("hello") == (True, expected)
+
+
+def test_attempts_are_logged(detector):
+    detector.check_keyword("invoice")
+    detector.check_path_access("/Volumes/Finance")
+    detector.check_domain("https://github.com")
+
+    stats = detector.get_stats()
+    assert stats['total_attempts'] == 2
+    assert stats['by_type'] == {'keyword': 1, 'path': 1}
+
+
+@pytest.fixture
+def volume(monkeypatch):
+    """Fake Finance volume: flip state['mounted'], record diskutil calls"""
+    state = {'mounted': False, 'commands': []}
+    mount_point = "/Volumes/Finance"
+    exists = os.path.exists
+
+    def fake_run(cmd, **kwargs):
+        state['commands'].append(cmd)
+        if cmd[0] == 'diskutil':
+            state['mounted'] = False
+        return SimpleNamespace(returncode=0, stdout="", stderr="")
+
+    monkeypatch.setattr(os.path, "ismount", lambda path: path == mount_point and state['mounted'])
+    monkeypatch.setattr(os.path, "exists",
+                        lambda path: state['mounted'] if path == mount_point else exists(path))
+    monkeypatch.setattr(subprocess, "run", fake_run)
+    return state
+
+
+def test_security_check_sees_new_mount(volume):
+    guard = FinanceGuard(CONFIG)
+    assert not guard.check_system_security()['volume_mounted']
+
+    volume['mounted'] = True
+    check = guard.check_system_security()
+    assert check['volume_mounted']
+    assert not check['secure']
+
+
+def test_lockdown_unmounts_new_mount(volume, tmp_path):
+    guard = FinanceGuard(CONFIG)
+    assert not guard.volume_guard.is_mounted()
+    assert not guard.get_status()['volume']['mounted']
+
+    volume['mounted'] = True
+    logger = AuditLogger(log_dir=str(tmp_path))
+    result = guard.emergency_lockdown(logger)
+    logger.close()
+
+    assert result['actions'][0]['message'] == "Volume unmounted successfully"
+    assert ['diskutil', 'unmount', "/Volumes/Finance"] in volume['commands']
+    assert not volume['mounted']
+
+
+def test_force_unmount_ignores_memo(volume):
+    guard = FinanceGuard(CONFIG)
+    assert not guard.volume_guard.is_mounted()
+
+    volume['mounted'] = True
+    assert guard.volume_guard.force_unmount() == (True, "Volume unmounted successfully")
@@ -0,0 +1,86 @@
+"""
+KillSwitch: atomic state writes and the stat-keyed state cache
+"""
+
+import threading
+
+import pytest
+
+from src.security import kill_switch as kill_switch_module
+from src.security.kill_switch import KillSwitch, PanicPhrase
+
+
+@pytest.fixture
+def state_file(tmp_path, monkeypatch):
+    path = tmp_path / ".killswitch"
+    monkeypatch.setattr(kill_switch_module, "_STATE_PATH", path)
+    return path
+
+
+def test_concurrent_writes_never_raise(state_file):
+    """CLI and menu bar writing at the same time must not break an emergency stop"""
+    switches = [KillSwitch() for _ in range(3)]
+    errors = []
+
+    def write(switch):
+        for _ in range(100):
+            try:
+                switch._write_state("paused")
+                switch._write_state("active")
+            except Exception as e:
+                errors.append(e)
+
+    threads = [threading.Thread(target=write, args=(switch,)) for switch in switches]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert KillSwitch().is_active()
+    assert [p.name for p in state_file.parent.iterdir()] == [state_file.name]
+
+
+def test_state_change_by_other_instance(state_file, capsys):
+    """A cached state is dropped as soon as another process replaces the file"""
+    menu_bar = KillSwitch()
+    cli = KillSwitch()
+    assert menu_bar.is_active()
+
+    cli.kill()
+    assert menu_bar.is_killed()
+    assert menu_bar.get_status()["state"] == "killed"
+    with pytest.raises(SystemExit):
+        menu_bar.check_or_block()
+
+    cli.reset()
+    cli.pause()
+    assert menu_bar.is_paused()
+    with pytest.raises(RuntimeError):
+        menu_bar.check_or_block()
+
+    cli.resume()
+    assert menu_bar.check_or_block()
+    assert menu_bar.get_status()["active"]
+
+
+@pytest.mark.parametrize("text,expected", [
+    ("please stop everything now", True),
+    ("notfall stop", True),
+    ("bitte abbrechen", True),
+    ("panic", True),
+    ("stop the music", False),
+    ("", False),
+], ids=["english", "german", "german_word", "single_word", "no_phrase", "empty"])
+def test_panic_phrase(text, expected):
+    assert PanicPhrase.detect(text) == expected
+
+
+@pytest.mark.parametrize("text", [
+    "Please STOP EVERYTHING now",
+    "Notfall Stop!",
+    "STOPP ALLES",
+    "AbBrEcHeN",
+], ids=["english_upper", "german_mixed", "german_upper", "alternating"])
+def test_panic_phrase_casefold(text):
+    assert PanicPhrase.detect(text)
@@ -0,0 +1,86 @@
+"""
+PolicyValidator decision cache
+Cached args-only checks must never change a decision
+"""
+
+import os
+
+import yaml
+
+from executor.executor import ActionExecutor
+from executor.validator import PolicyValidator
+
+from conftest import POLICY_PATH, load_policy
+
+REPO_PATH = '/Users/dsselmanovic/activi-dev-repos/super-mac-assistant'
+
+
+def _write_policy(path, policy):
+    with open(path, 'w') as f:
+        yaml.safe_dump(policy, f)
+
+
+def test_confirmation_not_reused(validator, audit_logger, monkeypatch):
+    """A confirmed Risk-2 action needs a new confirmation next time"""
+    executor = ActionExecutor(validator, audit_logger)
+    monkeypatch.setattr(executor, '_action_git_push', lambda args: {'success': True})
+    args = {'repo_path': REPO_PATH}
+
+    result = executor.execute('git_push', args, trigger='test', agent='test')
+    assert result.get('requires_confirmation')
+
+    result = executor.confirm_and_execute(result['challenge_id'], trigger='test', agent='test')
+    assert result['success']
+
+    result = executor.execute('git_push', args, trigger='test', agent='test')
+    assert result.get('requires_confirmation')
+    assert validator.validate_action('git_push', args).result.value == 'pending_confirmation'
+
+
+def test_cache_key_includes_type():
+    """10 == 10.0, but only 10 is an integer"""
+    validator = PolicyValidator(policy_path=str(POLICY_PATH))
+
+    assert validator.validate_action('tail_log', {'log_type': 'audit', 'lines': 10}).result.value == 'allowed'
+    assert validator.validate_action('tail_log', {'log_type': 'audit', 'lines': 10.0}).result.value == 'denied'
+
+
+def test_reload_on_policy_change(tmp_path):
+    """Editing policy.yaml on disk invalidates cached decisions"""
+    policy = dict(load_policy(str(POLICY_PATH)))
+    policy_file = tmp_path / "policy.yaml"
+    _write_policy(policy_file, policy)
+
+    validator = PolicyValidator(policy_path=str(policy_file))
+    assert validator.validate_action('status_overview', {}).result.value == 'allowed'
+
+    policy['actions'] = dict(policy['actions'])
+    policy['actions']['status_overview'] = dict(policy['actions']['status_overview'], risk=3)
+    _write_policy(policy_file, policy)
+    st = os.stat(policy_file)
+    os.utime(policy_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    assert validator.validate_action('status_overview', {}).result.value == 'denied'
+
+
+def test_symlink_swap_is_revalidated(tmp_path):
+    """Path containment is resolved on every call, not cached"""
+    repos_root = tmp_path / "repos"
+    (repos_root / "project").mkdir(parents=True)
+    outside = tmp_path / "outside"
+    outside.mkdir()
+
+    policy = dict(load_policy(str(POLICY_PATH)))
+    policy['root_paths'] = dict(policy['root_paths'], repos_root=str(repos_root))
+    policy_file = tmp_path / "policy.yaml"
+    _write_policy(policy_file, policy)
+    validator = PolicyValidator(policy_path=str(policy_file))
+
+    link = repos_root / "link"
+    link.symlink_to(repos_root / "project")
+    args = {'repo_path': str(link)}
+    assert validator.validate_action('git_push', args).result.value == 'pending_confirmation'
+
+    link.unlink()
+    link.symlink_to(outside)
+    assert validator.validate_action('git_push', args).result.value == 'denied'